@@ -0,0 +1,195 @@
+import os
+import sys
+import gc
+import json
+import time
+import random
+import platform
+import argparse
+
+# Headless and deterministic: no window, no audio device, fixed seed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.chdir(os.path.dirname(os.path.abspath(__file__))) # Sheet paths are relative to the project
+
+import pygame
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, INTERNAL_WIDTH, INTERNAL_HEIGHT, FPS
+from src.engine.entity import Entity
+from src.engine.sim_clock import SimClock
+from src.game.weapons import NormalShot, Laser
+from src.game.shield import Shield
+
+DEFAULT_BASELINE = "benchmark_baseline.json"
+
+# Engine hot-path microbenchmarks.
+# Each benchmark builds its fixture once and returns (step, iterations): step() is
+# timed `iterations` times per repeat with the GC off, and the best repeat counts
+# (the least disturbed run is the most repeatable number).
+BENCHMARKS = {}
+
+def benchmark(name):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+def scattered(count, x0, x1, y0, y1):
+    return [(random.uniform(x0, x1), random.uniform(y0, y1)) for _ in range(count)]
+
+@benchmark("entity_update_500")
+def bench_entity_update(game):
+    group = pygame.sprite.Group()
+    for x, y in scattered(500, 0, INTERNAL_WIDTH, 0, INTERNAL_HEIGHT):
+        e = Entity([group], x, y)
+        e.vel.update(-1.5, 0.5)
+    return group.update, 200
+
+@benchmark("groupcollide_60x200")
+def bench_groupcollide(game):
+    enemies = pygame.sprite.Group()
+    bullets = pygame.sprite.Group()
+    for x, y in scattered(60, 300, INTERNAL_WIDTH, 0, INTERNAL_HEIGHT):
+        Entity([enemies], x, y, pygame.Surface((42, 42)))
+    for x, y in scattered(200, 0, INTERNAL_WIDTH, 0, INTERNAL_HEIGHT):
+        Entity([bullets], x, y, pygame.Surface((24, 12)))
+    return lambda: pygame.sprite.groupcollide(enemies, bullets, False, False), 500
+
+@benchmark("projectile_spawn")
+def bench_projectile_spawn(game):
+    group = pygame.sprite.Group()
+    def step():
+        for _ in range(10):
+            NormalShot([group], 100, 200)
+        Laser([group], 100, 240)
+        group.empty()
+    return step, 500
+
+@benchmark("shield_update")
+def bench_shield_update(game):
+    clock = SimClock(FPS)
+    game.player.clock = clock
+    shields = [Shield([], 100, 200 + i * 60, game.player) for i in range(2)]
+    def step():
+        clock.advance()
+        for s in shields:
+            s.update()
+    return step, 2000
+
+@benchmark("powerup_bar_draw")
+def bench_powerup_bar(game):
+    bar = game.powerup_bar
+    canvas = game.internal_surface
+    return lambda: bar.draw(canvas), 500
+
+@benchmark("level_background")
+def bench_level_background(game):
+    canvas = game.internal_surface
+    level = game.level
+    queue = game.render_queue
+    def step():
+        level.draw_background(canvas)
+        level.submit(queue)
+        queue.flush(canvas)
+    return step, 300
+
+@benchmark("present_scale_flip")
+def bench_present(game):
+    return game.renderer.present, 200
+
+@benchmark("game_draw")
+def bench_game_draw(game):
+    return game.draw, 200
+
+def make_game():
+    from src.engine.game import Game
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    internal_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    game = Game(screen, internal_surface, audio=False, autopilot=True)
+    # A few seconds of play so the scene has terrain, enemies and shots in it
+    for _ in range(240):
+        game.update()
+    return game
+
+def run_benchmark(name, repeat):
+    random.seed(1234)
+    game = make_game()
+    step, iterations = BENCHMARKS[name](game)
+    step() # Warm caches (sheet frames, label text, terrain chunks)
+
+    times = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for _ in range(iterations):
+                step()
+            times.append((time.perf_counter() - t0) / iterations * 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    times.sort()
+    return {"best_us": times[0], "median_us": times[len(times) // 2], "iterations": iterations, "repeat": repeat}
+
+def load_baseline(path):
+    try:
+        with open(path) as f:
+            return json.load(f)["results"]
+    except FileNotFoundError:
+        return None
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="S-Type engine microbenchmarks")
+    parser.add_argument("names", nargs="*", help="Benchmarks to run (default: all)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare against / save to")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.20, help="Allowed slowdown vs baseline (0.20 = 20%%)")
+    parser.add_argument("--repeat", type=int, default=7, help="Timed repeats per benchmark (best one counts)")
+    parser.add_argument("--list", action="store_true", help="List benchmark names")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+    unknown = [n for n in args.names if n not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmark(s): {', '.join(unknown)}")
+        return 2
+
+    pygame.init()
+    names = args.names or list(BENCHMARKS)
+    baseline = None if args.save else load_baseline(args.baseline)
+
+    results = {}
+    regressions = []
+    for name in names:
+        r = results[name] = run_benchmark(name, args.repeat)
+        line = f"{name:22} {r['best_us']:10.1f}us  (median {r['median_us']:.1f}us)"
+        if baseline and name in baseline:
+            ratio = r["best_us"] / baseline[name]["best_us"] - 1.0
+            line += f"  {ratio * 100:+6.1f}% vs baseline"
+            if ratio > args.threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({
+                "meta": {"python": platform.python_version(), "pygame": pygame.version.ver, "machine": platform.machine()},
+                "results": results,
+            }, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+    elif baseline is None:
+        print(f"No baseline at {args.baseline} (run with --save to create one)")
+
+    pygame.quit()
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold * 100:.0f}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
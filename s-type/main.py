@@ -1,21 +1,119 @@
+import os
 import sys
+import time
+import random
+import argparse
 import pygame
-from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, INTERNAL_WIDTH, INTERNAL_HEIGHT, SCALE_FACTOR
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, INTERNAL_WIDTH, INTERNAL_HEIGHT, SCALE_FACTOR, PACING_MODE, LATE_INPUT_SAMPLING, RENDERER, PIPELINED, AUDIO_ENABLED, AUDIO_FREQUENCY, AUDIO_BUFFER
 from src.engine.game import Game
+from src.engine.frame_pacer import FramePacer, PACING_MODES
+from src.engine.assets import AssetLoader
+from src.engine.audio import pre_init
+from src.engine.renderer import SurfaceRenderer, TextureRenderer, RENDERERS
+from src.engine.loading_screen import run_loading_screen
+from src.engine.session import SessionRecorder, SessionVerifier
+from src.engine.soak import SoakMonitor
+from src.engine.alloc_tracker import AllocationTracker
+from src.game.manifest import ASSET_MANIFEST
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="S-Type (Gradius III clone)")
+    parser.add_argument("--pacing", choices=PACING_MODES, default=PACING_MODE,
+                        help="Frame pacing strategy (sleep / busy / vsync)")
+    parser.add_argument("--late-input", action="store_true", default=LATE_INPUT_SAMPLING,
+                        help="Sample input as late as possible before the simulation tick")
+    parser.add_argument("--renderer", choices=RENDERERS, default=RENDERER,
+                        help="Software surface blits or SDL2 textures")
+    parser.add_argument("--software-renderer", action="store_true",
+                        help="Force SDL's software renderer for the texture backend (headless testing)")
+    parser.add_argument("--pipelined", action="store_true", default=PIPELINED,
+                        help="Simulate the next frame on a worker thread while this one renders")
+    parser.add_argument("--seed", type=int, help="RNG seed (default: from the clock, or the recorded one)")
+    parser.add_argument("--record", metavar="PATH", help="Record input and per-frame state hashes")
+    parser.add_argument("--verify", metavar="PATH", help="Replay a recorded session and report the first desync")
+    parser.add_argument("--speed", type=int, default=1, metavar="N",
+                        help="Fast-forward: N simulation steps per rendered frame (F7 cycles at runtime)")
+    parser.add_argument("--autopilot", action="store_true", help="Let the built-in bot play")
+    parser.add_argument("--soak", type=float, metavar="MINUTES",
+                        help="Autopilot soak test: play MINUTES of game time uncapped, then report trends")
+    parser.add_argument("--soak-report", metavar="PATH", help="Write soak samples to a JSON file")
+    parser.add_argument("--memprofile", action="store_true",
+                        help="Track surface allocations per call site and per frame, plus heap growth per wave")
+    parser.add_argument("--memprofile-report", metavar="PATH", help="Write the allocation report to a JSON file")
+    parser.add_argument("--mute", action="store_true", help="Disable sound effects")
+    parser.add_argument("--headless", action="store_true", help="No window or audio device (SDL dummy drivers)")
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    if args.soak:
+        args.autopilot = True
+        args.pacing = "uncapped"
+    audio = AUDIO_ENABLED and not args.mute
+    if audio:
+        pre_init(AUDIO_FREQUENCY, AUDIO_BUFFER)
     pygame.init()
-    pygame.display.set_caption("Gradius III (SNES) Clone - s-type")
-    
-    # Create the display window
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    
+    # Installed before any surface or font exists so load-time allocations are attributed too
+    memory = None
+    if args.memprofile:
+        memory = AllocationTracker()
+        memory.install()
+    caption = "Gradius III (SNES) Clone - s-type"
+    pygame.display.set_caption(caption)
+    pacer = FramePacer(FPS, args.pacing)
+
+    # Optional SDL2 texture backend (falls back to the surface path if unavailable)
+    renderer = None
+    screen = None
+    if args.renderer == "texture":
+        renderer = TextureRenderer.create((SCREEN_WIDTH, SCREEN_HEIGHT), (INTERNAL_WIDTH, INTERNAL_HEIGHT),
+                                          caption, vsync=args.pacing == "vsync", software=args.software_renderer)
+        if renderer:
+            pacer.vsync_active = renderer.vsync
+
+    if renderer is None:
+        # Create the display window (the pacer decides whether vsync is requested)
+        screen = pacer.create_display((SCREEN_WIDTH, SCREEN_HEIGHT))
+
     # Create the internal surface for pixel-perfect rendering
     internal_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    if renderer is None:
+        renderer = SurfaceRenderer(screen, internal_surface)
+
+    # Decode sheets and fonts in the background while a loading screen runs
+    loader = AssetLoader(ASSET_MANIFEST)
+    if not run_loading_screen(renderer, loader):
+        pygame.quit()
+        sys.exit()
+
+    # Determinism: everything random flows from one seeded RNG
+    verifier = SessionVerifier(args.verify) if args.verify else None
+    if args.seed is not None:
+        seed = args.seed
+    elif verifier:
+        seed = verifier.seed
+    else:
+        seed = int(time.time())
+    random.seed(seed)
+    recorder = SessionRecorder(args.record, seed) if args.record else None
 
     # Initialize the Game Engine
-    game = Game(screen, internal_surface)
-    
+    game = Game(screen, internal_surface, pacer, late_input=args.late_input, renderer=renderer,
+                recorder=recorder, verifier=verifier, autopilot=args.autopilot, audio=audio,
+                pipelined=args.pipelined)
+    if args.speed > 1:
+        game.sim_clock.set_speed(args.speed)
+    if args.soak:
+        game.soak = SoakMonitor(game)
+        game.soak_report_path = args.soak_report
+        game.max_frames = int(args.soak * 60 * FPS)
+    if memory:
+        game.memory = memory
+        game.memory_report_path = args.memprofile_report
+
     # Start the Game Loop
     game.run()
 
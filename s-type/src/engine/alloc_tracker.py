@@ -0,0 +1,207 @@
+import os
+import sys
+import json
+import tracemalloc
+import pygame
+
+# Surface-creating functions wrapped while tracking (module attributes, looked up at call time).
+# Methods of the C Surface type (copy, convert_alpha, subsurface) can't be patched;
+# of those only convert_alpha (once per asset) and create_sprite's copy allocate pixels.
+WRAPPED = [
+    (pygame.transform, "scale"),
+    (pygame.transform, "smoothscale"),
+    (pygame.transform, "scale_by"),
+    (pygame.transform, "rotate"),
+    (pygame.transform, "rotozoom"),
+    (pygame.transform, "flip"),
+    (pygame.image, "load"),
+    (pygame.image, "frombytes"),
+]
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+THIS_FILE = os.path.abspath(__file__)
+
+def call_site(depth=2):
+    # First frame outside this module, as "path:line (function)" relative to the project
+    frame = sys._getframe(depth)
+    while frame and os.path.abspath(frame.f_code.co_filename) == THIS_FILE:
+        frame = frame.f_back
+    if frame is None:
+        return "?"
+    path = os.path.relpath(frame.f_code.co_filename, PROJECT_ROOT)
+    return f"{path}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+def pixel_bytes(surface):
+    w, h = surface.get_size()
+    return w * h * surface.get_bytesize()
+
+
+class TrackedFont:
+    # Fonts are C objects whose render() can't be patched, so new fonts are wrapped
+    def __init__(self, font, tracker):
+        self._font = font
+        self._tracker = tracker
+
+    def render(self, *args, **kwargs):
+        surface = self._font.render(*args, **kwargs)
+        self._tracker.record(surface, "font.render")
+        return surface
+
+    def __getattr__(self, name):
+        return getattr(self._font, name)
+
+
+class AllocationTracker:
+    # Memory instrumentation mode.
+    # Surface pixel memory lives in SDL (invisible to tracemalloc), so surface
+    # creation is counted through wrappers, per call site and per frame. Python
+    # heap growth comes from tracemalloc snapshots taken at every enemy wave.
+    def __init__(self, top=15):
+        self.top = top
+        self.installed = False
+        self.originals = []
+
+        # call site -> [count, pixel bytes, count inside frames]
+        self.sites = {}
+        self.frame_allocs = 0
+        self.frame_bytes = 0
+        # Running per-frame totals (no per-frame list: the tracker must not grow the heap itself)
+        self.frames = 0
+        self.zero_frames = 0
+        self.total_allocs = 0
+        self.total_bytes = 0
+        self.max_allocs = 0
+        self.last_allocs = 0
+        self.last_bytes = 0
+        self.in_frame = False
+
+        # tracemalloc per wave
+        self.wave = None
+        self.snapshot = None
+        self.wave_diffs = [] # (wave, net bytes, [(site, size_diff, count_diff)])
+
+    def install(self):
+        # Before any asset loads so every surface is seen
+        tracker = self
+        for module, name in WRAPPED:
+            original = getattr(module, name)
+            self.originals.append((module, name, original))
+            setattr(module, name, self.wrap(original, f"{module.__name__.split('.')[-1]}.{name}"))
+
+        original_surface = pygame.Surface
+        class TrackedSurface(original_surface):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                tracker.record(self, "Surface()")
+        self.originals.append((pygame, "Surface", original_surface))
+        pygame.Surface = TrackedSurface
+
+        for name in ("Font", "SysFont"):
+            original = getattr(pygame.font, name)
+            self.originals.append((pygame.font, name, original))
+            setattr(pygame.font, name, self.wrap_font(original))
+
+        tracemalloc.start()
+        self.installed = True
+
+    def uninstall(self):
+        for module, name, original in reversed(self.originals):
+            setattr(module, name, original)
+        self.originals = []
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.installed = False
+
+    def wrap(self, fn, label):
+        def tracked(*args, **kwargs):
+            surface = fn(*args, **kwargs)
+            self.record(surface, label)
+            return surface
+        return tracked
+
+    def wrap_font(self, fn):
+        def tracked(*args, **kwargs):
+            return TrackedFont(fn(*args, **kwargs), self)
+        return tracked
+
+    def record(self, surface, label):
+        size = pixel_bytes(surface)
+        key = f"{call_site(3)} {label}"
+        site = self.sites.get(key)
+        if site is None:
+            site = self.sites[key] = [0, 0, 0]
+        site[0] += 1
+        site[1] += size
+        if self.in_frame:
+            site[2] += 1
+            self.frame_allocs += 1
+            self.frame_bytes += size
+
+    def begin_frame(self):
+        self.in_frame = True
+        self.frame_allocs = 0
+        self.frame_bytes = 0
+
+    def end_frame(self, wave):
+        self.in_frame = False
+        self.frames += 1
+        self.last_allocs = self.frame_allocs
+        self.last_bytes = self.frame_bytes
+        self.total_allocs += self.frame_allocs
+        self.total_bytes += self.frame_bytes
+        if self.frame_allocs == 0:
+            self.zero_frames += 1
+        elif self.frame_allocs > self.max_allocs:
+            self.max_allocs = self.frame_allocs
+        if wave != self.wave:
+            self.take_snapshot(wave)
+
+    def take_snapshot(self, wave):
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(True, os.path.join(PROJECT_ROOT, "*")),
+            tracemalloc.Filter(False, THIS_FILE),
+        ])
+        if self.snapshot is not None:
+            stats = snapshot.compare_to(self.snapshot, "lineno")
+            net = sum(s.size_diff for s in stats)
+            top = [(f"{os.path.relpath(s.traceback[0].filename, PROJECT_ROOT)}:{s.traceback[0].lineno}", s.size_diff, s.count_diff)
+                   for s in stats[:5] if s.size_diff]
+            self.wave_diffs.append((self.wave, net, top))
+        self.snapshot = snapshot
+        self.wave = wave
+
+    def debug_lines(self):
+        return [f"MEM surfaces/frame {self.last_allocs} ({self.last_bytes / 1024:.1f}KB)  sites {len(self.sites)}  "
+                f"heap {tracemalloc.get_traced_memory()[0] / 1048576:.1f}MB"]
+
+    def summary(self):
+        n = self.frames
+        ranked = sorted(self.sites.items(), key=lambda kv: (kv[1][2], kv[1][1]), reverse=True)
+        return {
+            "frames": n,
+            "zero_alloc_frames": self.zero_frames,
+            "surfaces_per_frame": self.total_allocs / n if n else 0.0,
+            "bytes_per_frame": self.total_bytes / n if n else 0.0,
+            "max_surfaces_in_frame": self.max_allocs,
+            "sites": [{"site": k, "count": v[0], "bytes": v[1], "in_frames": v[2]} for k, v in ranked],
+            "waves": [{"wave": w, "heap_diff": net, "top": top} for w, net, top in self.wave_diffs],
+        }
+
+    def report(self, path=None):
+        s = self.summary()
+        n = s["frames"]
+        print(f"Allocations: {s['surfaces_per_frame']:.2f} surfaces / {s['bytes_per_frame'] / 1024:.1f}KB per frame, "
+              f"max {s['max_surfaces_in_frame']}, {s['zero_alloc_frames']}/{n} frames allocated no surfaces")
+        print(f"Top surface allocation sites (in-frame count, total count, total pixel bytes):")
+        for site in s["sites"][:self.top]:
+            print(f"  {site['in_frames']:7} {site['count']:7} {site['bytes'] / 1024:10.1f}KB  {site['site']}")
+        if self.wave_diffs:
+            print("Python heap growth per wave (tracemalloc):")
+            for wave, net, top in self.wave_diffs[-5:]:
+                print(f"  wave {wave}: {net / 1024:+.1f}KB")
+                for where, size_diff, count_diff in top[:3]:
+                    print(f"      {size_diff / 1024:+8.1f}KB {count_diff:+6} blocks  {where}")
+        if path:
+            with open(path, "w") as f:
+                json.dump(s, f, indent=2)
+            print(f"Allocation report written to {path}")
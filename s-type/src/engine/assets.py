@@ -0,0 +1,129 @@
+import pygame
+import threading
+import time
+
+# Central asset registry.
+# Images here are already converted for the display, so callers can blit them directly.
+_images = {}
+_fonts = {}
+_sounds = {}
+_missing = set()
+
+def get_image(name):
+    return _images.get(name)
+
+def get_font(name):
+    return _fonts.get(name)
+
+def get_sound(name):
+    return _sounds.get(name)
+
+def store_image(name, surface):
+    _images[name] = surface
+
+def store_font(name, font):
+    _fonts[name] = font
+
+def store_sound(name, sound):
+    _sounds[name] = sound
+
+def prepare_image(surface):
+    # Convert to the display format for fast software blits.
+    # With the texture renderer there is no display surface (textures take any format).
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+def is_missing(name):
+    return name in _missing
+
+def mark_missing(name):
+    _missing.add(name)
+
+
+class AssetLoader:
+    # Decodes images and fonts on a worker thread into a staging area.
+    # convert_alpha() needs the display, so it happens on the main thread in pump().
+    #
+    # manifest entries:
+    #   ("image", name, path)
+    #   ("font", name, (sysfont_name, size))
+    #   ("sound", name, builder) - builder() returns raw PCM in the mixer's format
+    def __init__(self, manifest):
+        self.manifest = list(manifest)
+        self.staged = [] # (kind, name, object, decode_ms) waiting for the main thread
+        self.lock = threading.Lock()
+        self.thread = None
+        self.worker_done = False
+
+        self.loaded = 0
+        self.timings = [] # (name, kind, decode_ms, convert_ms)
+        self.start_time = 0
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        self.thread = threading.Thread(target=self._worker, name="AssetLoader", daemon=True)
+        self.thread.start()
+
+    def _worker(self):
+        try:
+            for kind, name, source in self.manifest:
+                t0 = time.perf_counter()
+                obj = None
+                try:
+                    if kind == "image":
+                        obj = pygame.image.load(source) # Decode only, no convert off the main thread
+                    elif kind == "font":
+                        font_name, size = source
+                        obj = pygame.font.SysFont(font_name, size)
+                    elif kind == "sound" and pygame.mixer.get_init():
+                        obj = source() # Synthesize / decode to PCM; Sound() wraps it on the main thread
+                except Exception as e:
+                    # Any failure only loses this entry (it falls back as missing)
+                    print(f"Error: Could not load {kind} '{name}' ({type(e).__name__}: {e})")
+                decode_ms = (time.perf_counter() - t0) * 1000.0
+
+                with self.lock:
+                    self.staged.append((kind, name, obj, decode_ms))
+        finally:
+            # Always signal completion so the loading screen can never wait forever
+            with self.lock:
+                self.worker_done = True
+
+    def pump(self):
+        # Call once per frame on the main thread: finalizes whatever the worker has staged
+        with self.lock:
+            staged = self.staged
+            self.staged = []
+
+        for kind, name, obj, decode_ms in staged:
+            t0 = time.perf_counter()
+            if obj is None:
+                mark_missing(name)
+            elif kind == "image":
+                store_image(name, prepare_image(obj))
+            elif kind == "sound":
+                store_sound(name, pygame.mixer.Sound(buffer=obj))
+            else:
+                store_font(name, obj)
+            convert_ms = (time.perf_counter() - t0) * 1000.0
+
+            self.timings.append((name, kind, decode_ms, convert_ms))
+            self.loaded += 1
+
+    @property
+    def progress(self):
+        if not self.manifest:
+            return 1.0
+        return self.loaded / len(self.manifest)
+
+    @property
+    def done(self):
+        with self.lock:
+            return self.worker_done and not self.staged
+
+    def report(self):
+        total_ms = (time.perf_counter() - self.start_time) * 1000.0
+        print(f"Assets loaded: {self.loaded}/{len(self.manifest)} in {total_ms:.1f}ms")
+        for name, kind, decode_ms, convert_ms in self.timings:
+            print(f"  {kind:5} {name:16} decode {decode_ms:7.2f}ms  convert {convert_ms:6.2f}ms")
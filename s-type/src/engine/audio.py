@@ -0,0 +1,94 @@
+import pygame
+from src.engine import assets
+
+def pre_init(frequency, buffer):
+    # Must run before pygame.init(): a small buffer keeps trigger-to-speaker latency low
+    pygame.mixer.pre_init(frequency, -16, 1, buffer)
+
+
+class AudioSystem:
+    # Plays preloaded effects on reserved channel pools, one pool per category.
+    # A full pool steals its oldest voice instead of dropping the new sound, and
+    # repeats of the same effect within a frame are merged into one voice.
+    def __init__(self, bank, pools, enabled=True):
+        self.categories = {name: category for name, (category, _builder) in bank.items()}
+        self.enabled = enabled and pygame.mixer.get_init() is not None
+        self.pools = {}
+        self.started = {} # channel index -> frame it started on (oldest gets stolen)
+        self.frame = 0
+
+        # Trigger statistics
+        self.counts = {category: 0 for category in pools}
+        self.last_counts = dict(self.counts)
+        self.playing_now = set()
+        self.triggers = 0
+        self.merged = 0
+        self.steals = 0
+        self.peak = 0
+
+        if not self.enabled:
+            return
+
+        # Reserve every pooled channel so nothing else can grab them
+        total = sum(pools.values())
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for category, count in pools.items():
+            self.pools[category] = [pygame.mixer.Channel(i) for i in range(index, index + count)]
+            index += count
+
+    def play(self, name):
+        category = self.categories.get(name)
+        if category is None:
+            return
+        self.counts[category] += 1
+        self.triggers += 1
+        if not self.enabled:
+            return
+        if name in self.playing_now:
+            self.merged += 1
+            return
+        sound = assets.get_sound(name)
+        if sound is None:
+            return
+
+        pool = self.pools[category]
+        channel = None
+        for c in pool:
+            if not c.get_busy():
+                channel = c
+                break
+        if channel is None:
+            # Voice stealing: cut the oldest voice in this category
+            channel = min(pool, key=lambda c: self.started.get(c.id, 0))
+            self.steals += 1
+
+        channel.play(sound)
+        self.started[channel.id] = self.frame
+        self.playing_now.add(name)
+
+    def end_frame(self):
+        total = sum(self.counts.values())
+        if total > self.peak:
+            self.peak = total
+        self.last_counts = self.counts
+        self.counts = {category: 0 for category in self.counts}
+        self.playing_now.clear()
+        self.frame += 1
+
+    def debug_lines(self):
+        if not self.enabled:
+            return ["AUDIO off"]
+        counts = "  ".join(f"{c} {n}" for c, n in self.last_counts.items())
+        busy = sum(c.get_busy() for pool in self.pools.values() for c in pool)
+        voices = sum(len(pool) for pool in self.pools.values())
+        return [f"AUDIO {counts}  voices {busy}/{voices}  steals {self.steals}"]
+
+    def report(self):
+        if not self.enabled:
+            print("Audio: disabled")
+            return
+        frequency, _size, _channels = pygame.mixer.get_init()
+        print(f"Audio: {self.triggers} triggers, {self.merged} merged, {self.steals} voice steals, "
+              f"peak {self.peak}/frame @ {frequency}Hz")
@@ -0,0 +1,33 @@
+import pygame
+
+class DebugOverlay:
+    # Simple text panel in the top-left corner. Toggled with F3.
+    # Subsystems are registered as callables returning a list of strings.
+    def __init__(self, surface, visible=False):
+        self.surface = surface
+        self.visible = visible
+        self.font = pygame.font.Font(None, 22)
+        self.sources = []
+        self.line_height = 18
+
+    def add_source(self, source):
+        self.sources.append(source)
+
+    def toggle(self):
+        self.visible = not self.visible
+        print(f"Debug Overlay: {self.visible}")
+
+    def draw(self, surface=None):
+        if not self.visible:
+            return
+        target = surface if surface is not None else self.surface
+
+        lines = []
+        for source in self.sources:
+            lines.extend(source())
+
+        y = 4
+        for line in lines:
+            text = self.font.render(line, False, (255, 255, 0))
+            target.blit(text, (4, y))
+            y += self.line_height
@@ -1,6 +1,9 @@
 import pygame
+from src.engine.render_queue import LAYER_ENEMIES
 
 class Entity(pygame.sprite.Sprite):
+    draw_layer = LAYER_ENEMIES # Draw layer for the RenderQueue (subclasses override)
+
     def __init__(self, groups, x, y, image=None):
         super().__init__(groups)
         self.image = image if image else pygame.Surface((16, 16)) # Placeholder
@@ -13,6 +16,12 @@ class Entity(pygame.sprite.Sprite):
         self.vel = pygame.math.Vector2(0, 0)
         self.speed = 0
 
+    def reset(self, x, y):
+        # Reuse protocol: restore spawn state in place instead of allocating a new entity
+        self.pos.update(x, y)
+        self.vel.update(0, 0)
+        self.rect.topleft = (x, y)
+
     def update(self, *args):
         self.pos += self.vel
         self.rect.topleft = self.pos
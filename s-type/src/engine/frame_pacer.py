@@ -0,0 +1,90 @@
+import pygame
+import time
+import math
+from collections import deque
+
+# Pacing strategies
+# sleep  - Clock.tick: coarse OS sleep, lowest CPU, most judder
+# busy   - Clock.tick_busy_loop: sleeps then spins the last stretch, smooth but burns a core
+# vsync  - Display waits for the monitor refresh; the clock only measures
+# uncapped - No limit at all (headless soak tests, benchmarks)
+PACING_MODES = ["sleep", "busy", "vsync", "uncapped"]
+
+class FramePacer:
+    def __init__(self, fps, mode="busy", history=240):
+        self.fps = fps
+        self.target_fps = fps
+        self.mode = mode if mode in PACING_MODES else "busy"
+        self.clock = pygame.time.Clock()
+        self.vsync_active = False
+
+        # Frame-to-frame intervals in ms (rolling window)
+        self.intervals = deque(maxlen=history)
+        self.last_stamp = None
+
+    def create_display(self, size, flags=0):
+        # Vsync in pygame needs SCALED (or OPENGL) and can be refused by the driver,
+        # so fall back to busy-wait pacing if we don't get it.
+        if self.mode == "vsync":
+            try:
+                screen = pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+                self.vsync_active = True
+                return screen
+            except pygame.error as e:
+                print(f"Vsync unavailable ({e}), falling back to busy pacing")
+                self.mode = "busy"
+        self.vsync_active = False
+        return pygame.display.set_mode(size, flags)
+
+    def set_slowdown(self, active, slowdown_fps):
+        # Authentic slowdown = run the whole frame at a lower rate instead of sleeping mid-update
+        self.target_fps = slowdown_fps if active else self.fps
+
+    def cycle_mode(self):
+        # Runtime switching only between the CPU pacing strategies.
+        # Vsync is tied to the display mode so it's picked at startup.
+        if self.vsync_active:
+            print("Pacing: vsync is fixed for this display")
+            return self.mode
+        self.mode = "sleep" if self.mode == "busy" else "busy"
+        self.reset_stats()
+        print(f"Pacing Mode: {self.mode}")
+        return self.mode
+
+    def tick(self):
+        if self.vsync_active:
+            # flip() already blocked on the refresh; only limit during slowdown
+            self.clock.tick(self.target_fps if self.target_fps != self.fps else 0)
+        elif self.mode == "uncapped":
+            self.clock.tick()
+        elif self.mode == "busy":
+            self.clock.tick_busy_loop(self.target_fps)
+        else:
+            self.clock.tick(self.target_fps)
+
+        now = time.perf_counter()
+        if self.last_stamp is not None:
+            self.intervals.append((now - self.last_stamp) * 1000.0)
+        self.last_stamp = now
+
+    def reset_stats(self):
+        self.intervals.clear()
+        self.last_stamp = None
+
+    def stats(self):
+        # Mean interval, jitter (stddev) and worst deviation from the target frame time
+        n = len(self.intervals)
+        if n == 0:
+            return {"mode": self.mode, "mean_ms": 0.0, "jitter_ms": 0.0, "worst_ms": 0.0, "fps": 0.0}
+
+        mean = sum(self.intervals) / n
+        var = sum((i - mean) ** 2 for i in self.intervals) / n
+        target = mean if self.mode == "uncapped" else 1000.0 / self.target_fps
+        worst = max(abs(i - target) for i in self.intervals)
+        return {
+            "mode": "vsync" if self.vsync_active else self.mode,
+            "mean_ms": mean,
+            "jitter_ms": math.sqrt(var),
+            "worst_ms": worst,
+            "fps": 1000.0 / mean if mean > 0 else 0.0,
+        }
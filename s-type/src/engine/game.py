@@ -1,23 +1,52 @@
 import pygame
 import sys
 import time
-from src.settings import FPS, SLOWDOWN_ENABLED, SLOWDOWN_THRESHOLD, COLOR_BLACK, SCALE_FACTOR, INTERNAL_HEIGHT, INTERNAL_WIDTH
+from src.settings import AUDIO_ENABLED, AUDIO_CHANNELS, SIM_SPEEDS, PIPELINED, FPS, SLOWDOWN_ENABLED, SLOWDOWN_THRESHOLD, SLOWDOWN_FPS, PACING_MODE, LATE_INPUT_SAMPLING, PARTICLE_CAPACITY, PARTICLE_EMIT_CAP, QUALITY_GOVERNOR, COLOR_BLACK, SCALE_FACTOR, INTERNAL_HEIGHT, INTERNAL_WIDTH
 from src.engine.input_handler import InputHandler
+from src.engine.frame_pacer import FramePacer
+from src.engine.sim_clock import SimClock
+from src.engine.debug_overlay import DebugOverlay
+from src.engine.latency import LatencyMonitor
+from src.engine.renderer import SurfaceRenderer
+from src.engine.state_hash import StateHasher
+from src.engine.quality_governor import QualityGovernor
+from src.engine.audio import AudioSystem
+from src.engine.render_queue import RenderQueue, LAYER_ENEMY_BULLETS, LAYER_PARTICLES
+from src.engine.pipeline import FrameSnapshot, SimulationThread
 from src.game.player import Player
 from src.game.ui import PowerUpBar
 from src.game.capsule import Capsule
 from src.game.level import Level
+from src.game.particles import ParticleSystem
+from src.game.bullet_patterns import EnemyBulletSystem
+from src.game.autopilot import Autopilot
+from src.game.sound_bank import SOUND_BANK
 import random
 
 class Game:
-    def __init__(self, screen, internal_surface):
+    def __init__(self, screen, internal_surface, pacer=None, late_input=LATE_INPUT_SAMPLING, renderer=None,
+                 recorder=None, verifier=None, autopilot=False, soak=None, max_frames=None,
+                 audio=AUDIO_ENABLED, pipelined=PIPELINED):
         self.screen = screen
         self.internal_surface = internal_surface
-        self.clock = pygame.time.Clock()
+        self.renderer = renderer if renderer else SurfaceRenderer(screen, internal_surface)
+        self.render_queue = RenderQueue()
+        self.pacer = pacer if pacer else FramePacer(FPS, PACING_MODE)
+        self.clock = self.pacer.clock
+        self.sim_clock = SimClock(FPS, SIM_SPEEDS) # Simulation time (every gameplay timer reads this)
         self.running = True
         
         # Input
         self.input_handler = InputHandler()
+        # Pipelined mode simulates on a worker thread; events stay on the main thread,
+        # so late sampling (which pumps events mid-simulation) is off there
+        self.pipelined = pipelined
+        self.pipeline = None
+        self.late_input = late_input and not pipelined
+        self.latency = LatencyMonitor()
+
+        # Audio (effects preloaded by the AssetLoader)
+        self.audio = AudioSystem(SOUND_BANK, AUDIO_CHANNELS, audio)
 
         # Entity Groups
         self.all_sprites = pygame.sprite.Group()
@@ -30,63 +59,187 @@ class Game:
         self.player = Player([self.all_sprites], 20, INTERNAL_HEIGHT // 2)
         self.player.bullet_groups = [self.all_sprites, self.bullet_group] 
         
+        # Enemy fire (closed-form volleys, not sprites)
+        self.enemy_bullets = EnemyBulletSystem()
+        self.enemy_bullets.target = self.player
+        
         # Level Manager
         self.level = Level(self)
+        self.player.terrain = self.level.collision
+        self.player.audio = self.audio
+        self.player.clock = self.sim_clock
+        
+        # Effects
+        self.particles = ParticleSystem(PARTICLE_CAPACITY, PARTICLE_EMIT_CAP)
         
         # UI
         self.powerup_bar = PowerUpBar(self.internal_surface, self.player.powerup_manager)
         
         # Debug / Testing
         self.slowdown_active = SLOWDOWN_ENABLED
-        self.respawn_timer = 0
+        self.respawn_timer = 0 # Frames left before respawning
+        # Autopilot / soak testing
+        self.autopilot = Autopilot(self) if autopilot else None
+        self.soak = soak
+        self.soak_report_path = None
+        self.max_frames = max_frames # Stop after this many simulated frames
+        self.memory = None # AllocationTracker when memory instrumentation is on
+        self.memory_report_path = None
+        
+        # Adaptive quality (cosmetic cuts under load)
+        self.governor = QualityGovernor(self, FPS)
+        self.governor.enabled = QUALITY_GOVERNOR
+        
+        # Determinism checks (per-frame state hash, optional record / verify session)
+        self.state_hasher = StateHasher(self)
+        self.recorder = recorder
+        self.verifier = verifier
+        self.hash_time_us = 0.0
         
+        self.debug_overlay = DebugOverlay(self.internal_surface)
+        self.debug_overlay.add_source(self.pacing_debug_lines)
+        self.debug_overlay.add_source(self.sim_clock.debug_lines)
+        self.debug_overlay.add_source(self.renderer.debug_lines)
+        self.debug_overlay.add_source(self.render_queue.debug_lines)
+
+        self.debug_overlay.add_source(self.terrain_debug_lines)
+        self.debug_overlay.add_source(self.level.debug_lines)
+        self.debug_overlay.add_source(self.latency_debug_lines)
+        self.debug_overlay.add_source(self.particle_debug_lines)
+        self.debug_overlay.add_source(self.hash_debug_lines)
+        self.debug_overlay.add_source(self.governor.debug_lines)
+        self.debug_overlay.add_source(self.audio.debug_lines)
+
+    def pacing_debug_lines(self):
+        st = self.pacer.stats()
+        return [
+            f"PACING {st['mode']}  {st['fps']:.1f} fps",
+            f"FRAME {st['mean_ms']:.2f}ms  JITTER {st['jitter_ms']:.2f}ms  WORST {st['worst_ms']:.2f}ms",
+        ]
+
+    def latency_debug_lines(self):
+        st = self.latency.stats()
+        mode = "LATE" if self.late_input else "EARLY"
+        # Measured from when the event is dequeued (time spent in the SDL queue is not seen)
+        return [f"INPUT LAG ({mode}, from dequeue) p50 {st['p50']:.1f}ms  p95 {st['p95']:.1f}ms  p99 {st['p99']:.1f}ms"]
+
+    def particle_debug_lines(self):
+        p = self.particles
+        return [
+            f"PARTICLES {p.count}/{p.capacity}  emitted {p.emitted}  dropped {p.dropped}",
+            f"ENEMY BULLETS {self.enemy_bullets.live}  volleys {len(self.enemy_bullets.volleys)}",
+        ]
+
+    def hash_debug_lines(self):
+        mode = "RECORD" if self.recorder else "VERIFY" if self.verifier else "LIVE"
+        return [f"STATE {mode} frame {self.state_hasher.frame}  {self.state_hasher.chain:08x}  ({self.hash_time_us:.0f}us)"]
+
+    def terrain_debug_lines(self):
+        t = self.level.terrain
+        return [f"TERRAIN x={int(self.level.scroll_x)}  chunks {len(t.chunks)}  built {t.chunks_built}  evicted {t.chunks_evicted}"]
+
     def respawn_player(self):
         print("Respawning Player...")
-        # Create fresh player (resetting all powerups)
-        self.player = Player([self.all_sprites], 20, INTERNAL_HEIGHT // 2)
-        # Re-link groups
-        self.player.bullet_groups = [self.all_sprites, self.bullet_group] 
-        self.player.powerup_manager.player = self.player # Ensure logic links back if needed, though clean init usually sets it.
-        # Note: PowerUpBar holds a reference to the OLD powerup_manager. We need to update it!
-        self.powerup_bar.manager = self.player.powerup_manager
+        # Reset the existing player in place (resets all powerups).
+        # Player, PowerUpManager and bullet groups keep their identity, so the
+        # PowerUpBar reference stays valid.
+        self.player.respawn(20, INTERNAL_HEIGHT // 2)
         self.respawn_timer = 0
 
     def handle_events(self):
         for event in pygame.event.get():
+            self.input_handler.process_event(event)
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_F1:
                     self.slowdown_active = not self.slowdown_active
                     print(f"Slowdown Enabled: {self.slowdown_active}")
+                    if not self.slowdown_active:
+                        self.pacer.set_slowdown(False, SLOWDOWN_FPS)
+                elif event.key == pygame.K_F2:
+                    self.pacer.cycle_mode()
+                elif event.key == pygame.K_F3:
+                    self.debug_overlay.toggle()
+                elif event.key == pygame.K_F4:
+                    # Late sampling pumps events mid-simulation, which runs on the worker when pipelined
+                    if self.pipelined:
+                        print("Late Input Sampling: unavailable in pipelined mode")
+                    else:
+                        self.late_input = not self.late_input
+                        print(f"Late Input Sampling: {self.late_input}")
+                elif event.key == pygame.K_F6:
+                    self.governor.toggle()
+                elif event.key == pygame.K_F7:
+                    self.sim_clock.cycle_speed()
                 
+    def read_input(self):
+        # Replayed input in verify mode, live keyboard otherwise
+        if self.verifier:
+            self.input_handler.discard_pending()
+            return self.verifier.next_input()
+        if self.autopilot:
+            self.input_handler.discard_pending()
+            return self.autopilot.update()
+        return self.input_handler.update()
+
     def update(self):
+        input_data = self.simulate()
+        self.sim_clock.advance()
+        
+        # Fingerprint the frame for record / verify
+        t0 = time.perf_counter()
+        chain, hashes = self.state_hasher.compute()
+        self.hash_time_us = (time.perf_counter() - t0) * 1e6
+        if self.recorder:
+            self.recorder.record(input_data, chain, hashes)
+        if self.verifier:
+            self.verifier.check(chain, hashes)
+            if self.verifier.finished:
+                self.running = False
+
+    def simulate(self):
+        # Returns the input consumed this frame (None while the player is dead)
+        # Effects keep animating while the player is dead
+        self.particles.update()
+        
         # 0. Respawn Logic
         if not self.player.alive():
+            if self.late_input:
+                self.handle_events() # Late mode skips the top-of-loop drain: keep QUIT / F-keys working
             if self.respawn_timer == 0:
-                self.respawn_timer = pygame.time.get_ticks()
+                self.respawn_timer = self.sim_clock.frames_for(2000)
             
-            # Wait 2 seconds
-            if pygame.time.get_ticks() - self.respawn_timer > 2000: 
+            # Wait 2 seconds (simulated)
+            self.respawn_timer -= 1
+            if self.respawn_timer <= 0:
                 self.respawn_player()
                 # Activate 3s invulnerability
                 self.player.activate_invulnerability(3000)
             
             # PAUSE GAME: Return early so enemies don't move/spawn while you are dead
-            return 
+            self.input_handler.discard_pending()
+            return None
         
         # 1. Get Input
-        input_data = self.input_handler.update()
+        if not self.late_input:
+            input_data = self.read_input()
+
+        # 2. Update Level (Spawning, Background)
+        self.level.update()
+        
+        # Late sampling: drain events (not done at the top of the loop in this mode)
+        # and poll the keyboard right before the simulation step
+        if self.late_input:
+            self.handle_events()
+            input_data = self.read_input()
         
         # Debug Capsule Spawn
         if input_data.get('debug_capsule', False):
              c = Capsule([self.all_sprites, self.capsule_group], INTERNAL_WIDTH, random.randint(20, INTERNAL_HEIGHT - 20))
 
-        # 2. Update Level (Spawning, Background)
-        self.level.update()
-
         # 3. Update all sprites
-        self.all_sprites.update(1, input_data)
+        self.all_sprites.update(self.sim_clock.dt_ms, input_data)
         
         # 4. Collision Logic
         if self.player.alive() and not self.player.invulnerable:
@@ -98,12 +251,41 @@ class Game:
              hits = pygame.sprite.spritecollide(self.player, self.capsule_group, True)
              for hit in hits:
                  self.player.powerup_manager.collect_capsule()
+                 self.audio.play("capsule")
         
         # Player vs Enemies (Only if not invulnerable)
         if self.player.alive() and not self.player.invulnerable:
             hits = pygame.sprite.spritecollide(self.player, self.enemy_group, True) # True: Kill enemy on impact
+            for enemy in hits:
+                self.particles.explode(enemy.rect)
+                self.audio.play("explosion")
             if hits:
                 self.player.take_damage()
+                if not self.player.alive():
+                    self.particles.explode(self.player.rect, 96, 9.0)
+                    self.audio.play("player_explosion")
+        
+        # Enemy Bullets vs Player / Shields (bulk test inside the bullet system)
+        was_alive = self.player.alive()
+        self.enemy_bullets.update()
+        if was_alive and not self.player.alive():
+            self.particles.explode(self.player.rect, 96, 9.0)
+            self.audio.play("player_explosion")
+        
+        # Player vs Terrain (Gradius rules: touching rock is fatal, even with shields).
+        # Respawn invulnerability only keeps the ship out of the rock, if there is room.
+        if self.player.alive() and self.player.hits_terrain() and not (
+                self.player.invulnerable and self.player.push_out_of_terrain()):
+            self.player.kill()
+            self.particles.explode(self.player.rect, 96, 9.0)
+            self.audio.play("player_explosion")
+            print("Player Crashed Into Terrain!")
+        
+        # Bullets vs Terrain (missiles handle their own ground-following)
+        terrain = self.level.collision
+        for bullet in self.bullet_group.sprites():
+            if not bullet.hugs_terrain and terrain.rect_hits(bullet.rect):
+                bullet.kill()
             
         # Bullets vs Enemies
         # groupcollide(group1, group2, dokill1, dokill2)
@@ -111,44 +293,144 @@ class Game:
         for enemy, bullets in hits.items():
             enemy.take_damage(1) # Simple 1 dmg per shot
             if enemy.hp <= 0:
+                self.particles.explode(enemy.rect)
+                self.audio.play("explosion")
                 # Spawn Capsule
-                # Dialed back to 15% chance
-                if random.random() < 0.15:
+                # Dialed back to 15% chance (wave members drop one for the whole wave instead)
+                if enemy.formation is None and random.random() < 0.15:
                     Capsule([self.all_sprites, self.capsule_group], enemy.rect.centerx, enemy.rect.centery)
             
         # Slowdown Logic
+        # Lower the paced frame rate rather than sleeping mid-frame (keeps frame intervals even)
         if self.slowdown_active:
             entity_count = len(self.all_sprites)
-            if entity_count > SLOWDOWN_THRESHOLD:
-                # Artificial lag
-                time.sleep(0.01) 
+            self.pacer.set_slowdown(entity_count > SLOWDOWN_THRESHOLD, SLOWDOWN_FPS)
+        
+        return input_data
 
     def draw(self):
-        # 1. Clear internal surface
-        # self.internal_surface.fill(COLOR_BLACK) # Level draws background now
+        self.render(self.build_frame())
+
+    def build_frame(self, sim_ms=0.0):
+        # Simulation side: queue every blit on its layer and capture the draw data
+        queue = self.render_queue
+        self.level.submit(queue)
+        queue.submit_sprites(self.all_sprites)
+        queue.submit_many(LAYER_ENEMY_BULLETS, self.enemy_bullets.blit_sequence())
+        queue.submit_many(LAYER_PARTICLES, self.particles.blit_sequence())
         
-        # 2. Draw Background
-        self.level.draw_background(self.internal_surface)
+        stamp = self.input_handler.frame_input_stamp
+        self.input_handler.frame_input_stamp = None
+        return FrameSnapshot(self.sim_clock.frame, queue.take(), self.powerup_bar.state_key(), stamp, sim_ms)
+
+    def render(self, frame):
+        # Render side: only reads the snapshot (plus the overlay's live stats)
+        # 1. Start frame (internal surface, or the texture renderer's canvas)
+        canvas = self.renderer.begin_frame()
         
-        # 3. Draw everything to internal surface
-        self.all_sprites.draw(self.internal_surface)
+        # 2. Draw Background, then every layer in one batch
+        self.level.draw_background(canvas)
+        if frame.blits:
+            canvas.fblits(frame.blits)
         
-        # 4. Draw UI
-        self.powerup_bar.draw()
+        # 3. Draw UI
+        self.powerup_bar.draw(canvas, frame.hud_state)
+        self.debug_overlay.draw(canvas)
         
-        # 5. Scale and Blit to main screen
-        scaled_surface = pygame.transform.scale(self.internal_surface, self.screen.get_size())
-        self.screen.blit(scaled_surface, (0, 0))
+        # 4. Scale to the window and flip display
+        self.renderer.present()
         
-        # 6. Flip display
-        pygame.display.flip()
+        # Input-to-present latency for whatever input this frame simulated
+        if frame.input_stamp is not None:
+            self.latency.record(frame.input_stamp, time.perf_counter())
 
     def run(self):
+        if self.memory:
+            self.debug_overlay.add_source(self.memory.debug_lines)
+        if self.pipelined:
+            self.run_pipelined()
+        else:
+            self.run_serial()
+        self.shutdown()
+
+    def run_serial(self):
         while self.running:
-            self.handle_events()
-            self.update()
+            t0 = time.perf_counter()
+            if self.memory:
+                self.memory.begin_frame()
+            if not self.late_input:
+                self.handle_events() # Late sampling drains events inside simulate() instead
+            # Fast-forward runs several simulation steps per rendered frame
+            for _ in range(self.sim_clock.speed):
+                self.update()
+                if not self.running:
+                    break
             self.draw()
-            self.clock.tick(FPS)
-        
+            self.audio.end_frame()
+            if self.memory:
+                self.memory.end_frame(self.level.waves)
+            frame_ms = (time.perf_counter() - t0) * 1000.0
+            # Work time only: a vsync flip blocks until the refresh and would read as load
+            self.governor.observe(frame_ms - self.renderer.flip_ms)
+            if self.soak:
+                self.soak.observe(frame_ms)
+            self.pacer.tick()
+            self.sim_clock.sample()
+            
+            if self.max_frames and self.sim_clock.frame >= self.max_frames:
+                self.running = False
+
+    def run_pipelined(self):
+        # Frame N simulates on the worker while frame N-1 renders here
+        self.pipeline = SimulationThread(self)
+        self.debug_overlay.add_source(self.pipeline.debug_lines)
+        self.pipeline.start()
+        while self.running:
+            if self.memory:
+                self.memory.begin_frame() # Counts the worker's allocations for the next frame too
+            self.handle_events()
+            frame = self.pipeline.next_frame()
+            if frame is None:
+                break
+            t0 = time.perf_counter()
+            self.render(frame)
+            render_ms = (time.perf_counter() - t0) * 1000.0
+            self.pipeline.record(frame.sim_ms, render_ms)
+            if self.memory:
+                self.memory.end_frame(self.level.waves)
+            
+            # Throughput is set by the slower stage
+            frame_ms = max(frame.sim_ms, render_ms)
+            self.governor.observe(max(frame.sim_ms, render_ms - self.renderer.flip_ms))
+            if self.soak:
+                self.soak.observe(frame_ms)
+            self.pacer.tick()
+            self.sim_clock.sample()
+            
+            if self.max_frames and frame.frame >= self.max_frames:
+                self.running = False
+        self.running = False
+        self.pipeline.stop()
+        if self.pipeline.error:
+            raise self.pipeline.error
+
+    def shutdown(self):
+        st = self.pacer.stats()
+        print(f"Pacing ({st['mode']}): mean {st['mean_ms']:.2f}ms, jitter {st['jitter_ms']:.2f}ms, worst {st['worst_ms']:.2f}ms")
+        self.sim_clock.report()
+        if self.pipeline:
+            self.pipeline.report()
+        self.latency.report()
+        self.governor.report()
+        self.audio.report()
+        if self.recorder:
+            self.recorder.close()
+        if self.verifier:
+            self.verifier.report()
+        if self.soak:
+            self.soak.report(self.soak_report_path)
+        if self.memory:
+            self.memory.report(self.memory_report_path)
+            self.memory.uninstall()
         pygame.quit()
         sys.exit()
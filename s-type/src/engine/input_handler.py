@@ -1,4 +1,11 @@
 import pygame
+import time
+
+# Events that count as player input for latency measurement
+INPUT_EVENTS = (
+    pygame.KEYDOWN, pygame.KEYUP,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYAXISMOTION, pygame.JOYHATMOTION,
+)
 
 class InputHandler:
     def __init__(self):
@@ -13,8 +20,27 @@ class InputHandler:
         }
 
         self.keys_prev = pygame.key.get_pressed()
+        
+        # Latency tracking: when the oldest not-yet-simulated input event was dequeued
+        self.pending_stamp = None
+        self.frame_input_stamp = None # Input consumed by the current frame (cleared on present)
+
+    def process_event(self, event):
+        # pygame events carry no high-resolution timestamp, so stamp them as they are dequeued
+        if event.type in INPUT_EVENTS and self.pending_stamp is None:
+            self.pending_stamp = time.perf_counter()
+
+    def discard_pending(self):
+        # Input that never reaches the simulation (e.g. while dead) shouldn't count as lag
+        self.pending_stamp = None
 
     def update(self):
+        if self.pending_stamp is not None:
+            if self.frame_input_stamp is None:
+                self.frame_input_stamp = self.pending_stamp
+            self.pending_stamp = None
+        
+
         keys = pygame.key.get_pressed()
         
         self.actions['up'] = keys[pygame.K_UP]
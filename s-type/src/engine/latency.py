@@ -0,0 +1,32 @@
+from collections import deque
+
+class LatencyMonitor:
+    # Input-to-present latency: time from the first input event a frame consumed
+    # until that frame was flipped to the display.
+    def __init__(self, history=600):
+        self.samples = deque(maxlen=history) # ms
+        self.total_frames = 0
+
+    def record(self, input_stamp, present_stamp):
+        self.samples.append((present_stamp - input_stamp) * 1000.0)
+        self.total_frames += 1
+
+    def percentile(self, sorted_samples, p):
+        if not sorted_samples:
+            return 0.0
+        idx = min(len(sorted_samples) - 1, int(round(p / 100.0 * (len(sorted_samples) - 1))))
+        return sorted_samples[idx]
+
+    def stats(self):
+        ordered = sorted(self.samples)
+        return {
+            "count": len(ordered),
+            "p50": self.percentile(ordered, 50),
+            "p95": self.percentile(ordered, 95),
+            "p99": self.percentile(ordered, 99),
+            "max": ordered[-1] if ordered else 0.0,
+        }
+
+    def report(self):
+        st = self.stats()
+        print(f"Input Latency ({st['count']} samples): p50 {st['p50']:.1f}ms  p95 {st['p95']:.1f}ms  p99 {st['p99']:.1f}ms  max {st['max']:.1f}ms")
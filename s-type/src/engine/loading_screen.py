@@ -0,0 +1,35 @@
+import pygame
+from src.settings import INTERNAL_WIDTH, INTERNAL_HEIGHT, COLOR_BLACK, COLOR_WHITE
+
+def run_loading_screen(renderer, loader, fps=60):
+    # Keeps the window responsive while the AssetLoader works in the background.
+    # Returns False if the player closed the window during loading.
+    clock = pygame.time.Clock()
+    font = pygame.font.Font(None, 36) # Built-in font: no system font lookup needed
+
+    bar_width = INTERNAL_WIDTH // 2
+    bar_height = 12
+    bar_x = (INTERNAL_WIDTH - bar_width) // 2
+    bar_y = INTERNAL_HEIGHT // 2 + 24
+    label = font.render("LOADING", False, COLOR_WHITE)
+
+    loader.start()
+    # Also stop if the worker thread died (whatever it staged is still pumped below)
+    while not loader.done and loader.thread.is_alive():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+
+        loader.pump()
+
+        canvas = renderer.begin_frame()
+        canvas.fill(COLOR_BLACK)
+        canvas.blit(label, label.get_rect(center=(INTERNAL_WIDTH // 2, INTERNAL_HEIGHT // 2)))
+        canvas.fill((100, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+        canvas.fill((255, 0, 0), (bar_x, bar_y, int(bar_width * loader.progress), bar_height))
+        renderer.present()
+        clock.tick(fps)
+
+    loader.pump()
+    loader.report()
+    return True
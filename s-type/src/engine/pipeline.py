@@ -0,0 +1,101 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+
+# Everything the renderer needs for one frame, built by the simulation and never mutated.
+# blits: tuple of (surface, (x, y)) already in layer order
+# hud_state: PowerUpBar.state_key() at the end of the frame
+FrameSnapshot = namedtuple("FrameSnapshot", ["frame", "blits", "hud_state", "input_stamp", "sim_ms"])
+
+class SimulationThread:
+    # Pipelined mode: simulation steps run on this worker thread while the main
+    # thread renders the previous frame (scale / blits / flip release the GIL).
+    # The handoff is a rendezvous: after posting a snapshot the worker waits until
+    # the renderer has taken it, so only frame N+1 is simulated while N renders
+    # and latency grows by one frame at most.
+    def __init__(self, game):
+        self.game = game
+        self.handoff = queue.Queue(maxsize=1)
+        self.taken = threading.Event() # Set by the renderer once it holds the posted snapshot
+        self.renderer_waiting = False
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="Simulation", daemon=True)
+        self.error = None
+
+        self.stalls = 0 # Simulation finished a frame before the renderer took the last one
+        self.starved = 0 # Renderer was ready before the next frame was
+        self.sim_ms = 0.0
+        self.render_ms = 0.0
+        self.frames = 0
+        self.sim_total = 0.0
+        self.render_total = 0.0
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopping.set()
+        self.thread.join(timeout=1.0)
+
+    def run(self):
+        g = self.game
+        try:
+            while g.running and not self.stopping.is_set():
+                t0 = time.perf_counter()
+                for _ in range(g.sim_clock.speed):
+                    g.update()
+                    if not g.running:
+                        break
+                g.audio.end_frame()
+                snapshot = g.build_frame((time.perf_counter() - t0) * 1000.0)
+
+                # The slot is always empty here (the last snapshot was taken)
+                self.taken.clear()
+                if not self.renderer_waiting:
+                    self.stalls += 1
+                self.handoff.put(snapshot)
+                while not self.taken.wait(0.05):
+                    if self.stopping.is_set():
+                        return
+
+                if g.max_frames and g.sim_clock.frame >= g.max_frames:
+                    break
+        except Exception as e:
+            self.error = e
+            g.running = False
+
+    def next_frame(self):
+        # Called by the render thread; None if the simulation stopped meanwhile
+        if self.handoff.empty():
+            self.starved += 1
+        self.renderer_waiting = True
+        try:
+            while self.game.running:
+                try:
+                    frame = self.handoff.get(timeout=0.05)
+                    self.taken.set()
+                    return frame
+                except queue.Empty:
+                    if not self.thread.is_alive():
+                        return None
+            return None
+        finally:
+            self.renderer_waiting = False
+
+    def record(self, sim_ms, render_ms):
+        # Called by the render thread once per presented frame
+        self.sim_ms = sim_ms
+        self.render_ms = render_ms
+        self.frames += 1
+        self.sim_total += sim_ms
+        self.render_total += render_ms
+
+    def debug_lines(self):
+        return [f"PIPELINE sim {self.sim_ms:.2f}ms  render {self.render_ms:.2f}ms  "
+                f"stalls {self.stalls}  starved {self.starved}"]
+
+    def report(self):
+        n = max(self.frames, 1)
+        print(f"Pipeline: {self.frames} frames, sim {self.sim_total / n:.2f}ms / render {self.render_total / n:.2f}ms mean, "
+              f"{self.stalls} stalls, {self.starved} starved")
@@ -0,0 +1,96 @@
+from collections import deque
+
+# Cosmetic cuts, applied cumulatively (tier N includes every step below it).
+# Each must leave gameplay untouched: stars and particles use their own RNGs
+# and are not part of the state hash, so sessions verify at any tier.
+TIERS = [
+    "full quality",
+    "fewer background stars",
+    "cap particle emission",
+    "skip HUD redraws",
+]
+
+class QualityGovernor:
+    # Alternative to the artificial slowdown: watches frame work time (update + draw,
+    # not the pacing or vsync wait) against the 1/FPS budget and steps cosmetic quality
+    # down under load, back up once there is headroom again.
+    def __init__(self, game, fps, window=30, degrade_at=0.9, restore_at=0.6, hold_frames=60):
+        self.game = game
+        self.budget_ms = 1000.0 / fps
+        self.samples = deque(maxlen=window)
+        self.degrade_at = degrade_at
+        self.restore_at = restore_at
+        self.hold_frames = hold_frames # Minimum frames between transitions (no flapping)
+        self.cooldown = 0
+        self.enabled = True
+        self.tier = 0
+
+        # Baselines to restore to
+        self.base_stars = len(game.level.stars)
+        self.base_emit_cap = game.particles.emit_cap
+
+        # Mean frame time spent in each tier, to see what each cut buys
+        self.tier_time = [[0.0, 0] for _ in TIERS]
+        self.transitions = 0
+
+    def observe(self, frame_ms):
+        # Fast-forward frames hold several simulation steps, so their time says
+        # nothing about the 1/FPS budget: hold the current tier until back at x1
+        if self.game.sim_clock.speed > 1:
+            self.samples.clear()
+            return
+        self.samples.append(frame_ms)
+        stats = self.tier_time[self.tier]
+        stats[0] += frame_ms
+        stats[1] += 1
+
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return
+        if not self.enabled or len(self.samples) < self.samples.maxlen:
+            return
+
+        avg = sum(self.samples) / len(self.samples)
+        if avg > self.budget_ms * self.degrade_at and self.tier < len(TIERS) - 1:
+            self.set_tier(self.tier + 1, avg)
+        elif avg < self.budget_ms * self.restore_at and self.tier > 0:
+            self.set_tier(self.tier - 1, avg)
+
+    def set_tier(self, tier, avg_ms=0.0):
+        old = self.tier
+        old_mean = self.mean_ms(old)
+        self.tier = tier
+        self.apply()
+        self.cooldown = self.hold_frames
+        self.samples.clear()
+        self.transitions += 1
+        direction = "DOWN" if tier > old else "UP"
+        print(f"Quality {direction}: tier {old} -> {tier} ({TIERS[tier]}), "
+              f"avg {avg_ms:.2f}ms / {self.budget_ms:.2f}ms budget, tier {old} mean {old_mean:.2f}ms")
+
+    def apply(self):
+        g = self.game
+        t = self.tier
+        g.level.active_stars = self.base_stars // 3 if t >= 1 else self.base_stars
+        g.particles.emit_cap = self.base_emit_cap // 6 if t >= 2 else self.base_emit_cap
+        g.powerup_bar.cached = t >= 3
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if not self.enabled and self.tier:
+            self.set_tier(0)
+        print(f"Quality Governor: {self.enabled}")
+
+    def mean_ms(self, tier):
+        total, count = self.tier_time[tier]
+        return total / count if count else 0.0
+
+    def debug_lines(self):
+        state = "ON" if self.enabled else "OFF"
+        return [f"QUALITY {state} tier {self.tier} ({TIERS[self.tier]})"]
+
+    def report(self):
+        print(f"Quality Governor: {self.transitions} transitions")
+        for i, name in enumerate(TIERS):
+            if self.tier_time[i][1]:
+                print(f"  tier {i} {name:32} {self.tier_time[i][1]:6} frames  mean {self.mean_ms(i):.2f}ms")
@@ -0,0 +1,66 @@
+# Draw layers, back to front
+LAYER_BACKGROUND = 0
+LAYER_TERRAIN = 1
+LAYER_CAPSULES = 2
+LAYER_ENEMIES = 3
+LAYER_PLAYER_SHOTS = 4
+LAYER_OPTIONS = 5
+LAYER_PLAYER = 6
+LAYER_SHIELDS = 7
+LAYER_ENEMY_BULLETS = 8 # Above ships so incoming fire is never hidden
+LAYER_PARTICLES = 9
+
+LAYER_NAMES = ["bg", "terrain", "capsule", "enemy", "shot", "option", "player", "shield", "ebullet", "fx"]
+
+class RenderQueue:
+    # Collects (surface, dest) blits per layer during the frame and submits them
+    # in one Surface.fblits call. Inside a layer, blits are grouped by source
+    # surface (order within a layer is not significant); between layers the
+    # order is fixed by the layer number.
+    def __init__(self):
+        self.layers = [{} for _ in LAYER_NAMES] # id(surface) -> (surface, [dests])
+        self.counts = [0] * len(LAYER_NAMES) # Blits per layer in the last flush
+        self.calls = 0
+
+    def submit_many(self, layer, blit_sequence):
+        bucket = self.layers[layer]
+        for surface, dest in blit_sequence:
+            entry = bucket.get(id(surface))
+            if entry is None:
+                bucket[id(surface)] = (surface, [dest])
+            else:
+                entry[1].append(dest)
+
+    def submit_sprites(self, sprites):
+        # Sprites carry their own draw_layer (class attribute)
+        layers = self.layers
+        for s in sprites:
+            image = s.image
+            bucket = layers[s.draw_layer]
+            entry = bucket.get(id(image))
+            # Position as a tuple, not the sprite's live Rect (snapshots must not change)
+            if entry is None:
+                bucket[id(image)] = (image, [s.rect.topleft])
+            else:
+                entry[1].append(s.rect.topleft)
+
+    def take(self):
+        # The frame's blits in layer order as an immutable tuple; empties the queue
+        batch = []
+        for i, bucket in enumerate(self.layers):
+            start = len(batch)
+            for surface, dests in bucket.values():
+                batch.extend([(surface, d) for d in dests])
+            self.counts[i] = len(batch) - start
+            bucket.clear()
+        self.calls = 1 if batch else 0
+        return tuple(batch)
+
+    def flush(self, target):
+        batch = self.take()
+        if batch:
+            target.fblits(batch)
+
+    def debug_lines(self):
+        per_layer = " ".join(f"{name} {n}" for name, n in zip(LAYER_NAMES, self.counts) if n)
+        return [f"DRAW {sum(self.counts)} blits / {self.calls} call  {per_layer}"]
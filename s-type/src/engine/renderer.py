@@ -0,0 +1,130 @@
+import time
+import pygame
+
+RENDERERS = ["surface", "texture"]
+
+class SurfaceRenderer:
+    # Default path: software blits into the internal surface, scaled onto the window.
+    name = "surface"
+
+    def __init__(self, screen, internal_surface):
+        self.screen = screen
+        self.internal_surface = internal_surface
+        self.flip_ms = 0.0 # Time blocked in the last flip (the vsync wait)
+
+    def begin_frame(self):
+        return self.internal_surface
+
+    def present(self):
+        scaled_surface = pygame.transform.scale(self.internal_surface, self.screen.get_size())
+        self.screen.blit(scaled_surface, (0, 0))
+        t0 = time.perf_counter()
+        pygame.display.flip()
+        self.flip_ms = (time.perf_counter() - t0) * 1000.0
+
+    def debug_lines(self):
+        return ["RENDERER surface"]
+
+
+class TextureCanvas:
+    # Stands in for the internal surface when drawing through the GPU renderer.
+    # Implements just the Surface calls the game's draw code uses.
+    def __init__(self, backend, size):
+        self.backend = backend
+        self.size = size
+
+    def get_size(self):
+        return self.size
+
+    def fill(self, color, rect=None, special_flags=0):
+        renderer = self.backend.renderer
+        renderer.draw_color = color
+        if rect is None:
+            renderer.clear()
+        else:
+            renderer.fill_rect(pygame.Rect(rect))
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        tex = self.backend.texture_for(source)
+        alpha = source.get_alpha()
+        tex.alpha = 255 if alpha is None else alpha
+
+        if hasattr(dest, "topleft"): # Rect
+            dest = dest.topleft
+        rect = pygame.Rect(dest[0], dest[1], tex.width, tex.height)
+        if area is not None:
+            area = pygame.Rect(area)
+            rect.size = area.size
+        tex.draw(srcrect=area, dstrect=rect)
+        self.backend.draw_calls += 1
+        return rect
+
+    def fblits(self, blit_sequence, special_flags=0):
+        for source, dest in blit_sequence:
+            self.blit(source, dest)
+
+
+class TextureRenderer:
+    # Optional GPU path built on pygame._sdl2.video.
+    # Every Surface handed to blit() is uploaded once and cached as a Texture;
+    # the renderer's logical size takes care of the integer scale to the window.
+    name = "texture"
+
+    def __init__(self, window_size, logical_size, title="s-type", vsync=False, software=False, evict_after=120):
+        from pygame._sdl2.video import Window, Renderer, Texture
+        self.Texture = Texture
+
+        self.window = Window(title, size=window_size)
+        self.renderer = Renderer(self.window, accelerated=0 if software else -1, vsync=vsync)
+        self.renderer.logical_size = logical_size
+        self.vsync = vsync
+        self.canvas = TextureCanvas(self, logical_size)
+
+        # id(surface) -> [surface, texture, last_used_frame]
+        # The surface ref keeps the id from being recycled while cached.
+        self.textures = {}
+        self.evict_after = evict_after
+        self.frame = 0
+        self.uploads = 0
+        self.draw_calls = 0
+        self.flip_ms = 0.0 # Time blocked in the last present (the vsync wait)
+
+    @classmethod
+    def create(cls, window_size, logical_size, title="s-type", vsync=False, software=False):
+        # Returns None if this pygame build has no SDL2 renderer support
+        try:
+            return cls(window_size, logical_size, title, vsync, software)
+        except (ImportError, pygame.error) as e:
+            print(f"Texture renderer unavailable ({e}), using surface renderer")
+            return None
+
+    def texture_for(self, surface):
+        entry = self.textures.get(id(surface))
+        if entry is None:
+            tex = self.Texture.from_surface(self.renderer, surface)
+            tex.blend_mode = 1 # SDL_BLENDMODE_BLEND (alpha mod for invulnerability flashing)
+            entry = self.textures[id(surface)] = [surface, tex, self.frame]
+            self.uploads += 1
+        else:
+            entry[2] = self.frame
+        return entry[1]
+
+    def begin_frame(self):
+        self.draw_calls = 0
+        self.canvas.fill((0, 0, 0))
+        return self.canvas
+
+    def present(self):
+        t0 = time.perf_counter()
+        self.renderer.present()
+        self.flip_ms = (time.perf_counter() - t0) * 1000.0
+        self.frame += 1
+
+        # Drop textures for surfaces nobody has drawn recently (dead sprites, old text)
+        if self.frame % 60 == 0:
+            stale = [k for k, e in self.textures.items() if self.frame - e[2] > self.evict_after]
+            for k in stale:
+                del self.textures[k]
+
+    def debug_lines(self):
+        return [f"RENDERER texture  textures {len(self.textures)}  uploads {self.uploads}  draws {self.draw_calls}"]
@@ -0,0 +1,69 @@
+import json
+
+# Action keys stored as a bitmask per frame
+ACTION_BITS = ["up", "down", "left", "right", "shoot", "missile", "shoot_both", "powerup", "debug_capsule"]
+
+def pack_actions(actions):
+    if actions is None:
+        return -1 # Frame that didn't sample input (e.g. player dead)
+    bits = 0
+    for i, name in enumerate(ACTION_BITS):
+        if actions.get(name, False):
+            bits |= 1 << i
+    return bits
+
+def unpack_actions(bits):
+    return {name: bool(bits & (1 << i)) for i, name in enumerate(ACTION_BITS)}
+
+
+class SessionRecorder:
+    # JSON lines: a header with the RNG seed, then one line per simulated frame
+    # with the input bitmask, the chained state hash and per-subsystem hashes.
+    def __init__(self, path, seed):
+        self.path = path
+        self.file = open(path, "w")
+        self.file.write(json.dumps({"seed": seed, "version": 1}) + "\n")
+        self.frames = 0
+
+    def record(self, actions, chain, hashes):
+        self.file.write(json.dumps({"i": pack_actions(actions), "c": chain, "h": hashes}) + "\n")
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+        print(f"Session recorded: {self.frames} frames -> {self.path}")
+
+
+class SessionVerifier:
+    # Replays a recorded session's input and compares state hashes frame by frame.
+    def __init__(self, path):
+        self.path = path
+        with open(path) as f:
+            header = json.loads(f.readline())
+            self.frames = [json.loads(line) for line in f if line.strip()]
+        self.seed = header["seed"]
+        self.index = 0
+        self.diverged = None # (frame, [subsystems]) at the first mismatch
+
+    @property
+    def finished(self):
+        return self.index >= len(self.frames) or self.diverged is not None
+
+    def next_input(self):
+        bits = self.frames[self.index]["i"]
+        return None if bits < 0 else unpack_actions(bits)
+
+    def check(self, chain, hashes):
+        expected = self.frames[self.index]
+        if chain != expected["c"] and self.diverged is None:
+            bad = [name for name, value in expected["h"].items() if hashes.get(name) != value]
+            self.diverged = (self.index, bad)
+            print(f"DESYNC at frame {self.index}: {', '.join(bad) if bad else 'hash chain'} diverged")
+        self.index += 1
+
+    def report(self):
+        if self.diverged:
+            frame, bad = self.diverged
+            print(f"Verify FAILED: first divergence at frame {frame} in {', '.join(bad)}")
+        else:
+            print(f"Verify OK: {self.index}/{len(self.frames)} frames identical")
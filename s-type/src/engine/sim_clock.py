@@ -0,0 +1,60 @@
+import time
+from collections import deque
+
+class SimClock:
+    # The one source of simulation time.
+    # Timers read frames / simulated ms from here instead of pygame.time.get_ticks(),
+    # so a simulated frame behaves the same at 60 fps, uncapped, or several
+    # steps per rendered frame (fast-forward).
+    def __init__(self, fps, speeds=(1,), window=60):
+        self.fps = fps
+        self.dt_ms = 1000.0 / fps # Simulated ms per frame
+        self.frame = 0
+        self.speeds = list(speeds)
+        self.speed = self.speeds[0] # Simulation steps per rendered frame
+
+        # (wall time, frame) per rendered frame for the sim-seconds-per-wall-second rate
+        self.samples = deque(maxlen=window)
+        self.start_wall = time.perf_counter()
+
+    @property
+    def ms(self):
+        return self.frame * self.dt_ms
+
+    @property
+    def seconds(self):
+        return self.frame / self.fps
+
+    def frames_for(self, ms):
+        return max(1, round(ms / self.dt_ms))
+
+    def advance(self):
+        self.frame += 1
+
+    def set_speed(self, speed):
+        self.speed = max(1, int(speed))
+        self.samples.clear()
+        print(f"Simulation speed: x{self.speed}")
+
+    def cycle_speed(self):
+        i = self.speeds.index(self.speed) if self.speed in self.speeds else -1
+        self.set_speed(self.speeds[(i + 1) % len(self.speeds)])
+
+    def sample(self):
+        # Call once per rendered frame
+        self.samples.append((time.perf_counter(), self.frame))
+
+    def rate(self):
+        # Simulated seconds per wall second over the recent window
+        if len(self.samples) < 2:
+            return 0.0
+        (w0, f0), (w1, f1) = self.samples[0], self.samples[-1]
+        return (f1 - f0) / self.fps / (w1 - w0) if w1 > w0 else 0.0
+
+    def debug_lines(self):
+        return [f"SIM x{self.speed}  frame {self.frame}  t {self.seconds:.1f}s  {self.rate():.2f} sim-s/s"]
+
+    def report(self):
+        wall = time.perf_counter() - self.start_wall
+        ratio = self.seconds / wall if wall > 0 else 0.0
+        print(f"Simulated {self.seconds:.1f}s in {wall:.1f}s wall ({ratio:.2f} sim-s/s)")
@@ -0,0 +1,119 @@
+import gc
+import os
+import json
+import time
+from src.engine.entity import Entity
+
+def process_rss_mb():
+    # Current resident set size; Linux /proc first, peak RSS from resource as a fallback
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        return 0.0
+
+def percentile(ordered, p):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))]
+
+def slope(values):
+    # Least-squares trend per sample
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2
+    mean_y = sum(values) / n
+    num = sum((i - mean_x) * (v - mean_y) for i, v in enumerate(values))
+    den = sum((i - mean_x) ** 2 for i in range(n))
+    return num / den
+
+
+class SoakMonitor:
+    # Long-run stability sampling for autopilot soak tests.
+    # Every `interval` frames it records frame-time percentiles, sprite/group
+    # sizes, process RSS and how many killed entities are still referenced.
+    def __init__(self, game, interval=1800, growth_threshold=0.2):
+        self.game = game
+        self.interval = interval
+        self.growth_threshold = growth_threshold # Flag metrics that grow by more than this over the run
+        self.frame_times = []
+        self.samples = []
+        self.frames = 0
+        self.start = time.perf_counter()
+
+    def observe(self, frame_ms):
+        self.frame_times.append(frame_ms)
+        self.frames += 1
+        if self.frames % self.interval == 0:
+            self.sample()
+
+    def stale_entities(self):
+        # Killed sprites still reachable from somewhere (pooled Options/Shields included, but bounded)
+        gc.collect()
+        return sum(1 for o in gc.get_objects() if isinstance(o, Entity) and not o.alive())
+
+    def sample(self):
+        g = self.game
+        ordered = sorted(self.frame_times)
+        self.frame_times = []
+        s = {
+            "frame": self.frames,
+            "p50_ms": percentile(ordered, 50),
+            "p95_ms": percentile(ordered, 95),
+            "p99_ms": percentile(ordered, 99),
+            "all_sprites": len(g.all_sprites),
+            "enemies": len(g.enemy_group),
+            "dormant": g.level.dormant_count(),
+            "bullets": len(g.bullet_group),
+            "capsules": len(g.capsule_group),
+            "particles": g.particles.count,
+            "enemy_volleys": len(g.enemy_bullets.volleys),
+            "formations": len(g.level.formations),
+            "terrain_chunks": len(g.level.terrain.chunks),
+            "stale_entities": self.stale_entities(),
+            "rss_mb": process_rss_mb(),
+        }
+        self.samples.append(s)
+        print(f"[soak] frame {s['frame']}: p95 {s['p95_ms']:.2f}ms  sprites {s['all_sprites']}  "
+              f"stale {s['stale_entities']}  rss {s['rss_mb']:.1f}MB")
+
+    def trends(self):
+        # Compare the last quarter of the run to the first quarter, and the fitted slope
+        flagged = []
+        if len(self.samples) < 4:
+            return flagged
+        quarter = max(1, len(self.samples) // 4)
+        for key in self.samples[0]:
+            if key == "frame":
+                continue
+            values = [s[key] for s in self.samples]
+            early = sum(values[:quarter]) / quarter
+            late = sum(values[-quarter:]) / quarter
+            growth = (late - early) / early if early else (1.0 if late > 1 else 0.0)
+            if slope(values) > 0 and growth > self.growth_threshold:
+                flagged.append((key, early, late, growth))
+        return flagged
+
+    def report(self, path=None):
+        elapsed = time.perf_counter() - self.start
+        print(f"Soak: {self.frames} frames in {elapsed:.1f}s ({self.frames / max(elapsed, 1e-9):.0f} fps), {len(self.samples)} samples")
+        flagged = self.trends()
+        if flagged:
+            print("Upward trends (possible leaks / drift):")
+            for key, early, late, growth in flagged:
+                print(f"  {key:16} {early:10.2f} -> {late:10.2f}  (+{growth * 100:.0f}%)")
+        else:
+            print("No upward trends detected")
+
+        if path:
+            with open(path, "w") as f:
+                json.dump({"samples": self.samples, "flagged": [f[0] for f in flagged]}, f, indent=2)
+            print(f"Soak report written to {path}")
+        return flagged
@@ -0,0 +1,74 @@
+import random
+import struct
+import zlib
+
+# Order matters: reports name the first subsystem that differs.
+# Cosmetic state (stars, particles, HUD cache) is left out: the QualityGovernor
+# may change it without affecting gameplay.
+SUBSYSTEMS = ["rng", "level", "player", "powerups", "anim", "enemies", "bullets", "capsules", "enemy_bullets"]
+
+def pack_floats(values):
+    return struct.pack(f"{len(values)}d", *values)
+
+class StateHasher:
+    # Per-frame world fingerprint: one crc32 per subsystem, chained into a
+    # running hash so any divergence carries forward to every later frame.
+    def __init__(self, game):
+        self.game = game
+        self.chain = 0
+        self.frame = 0
+        self.last = {}
+
+    def entity_values(self, group, extra=None):
+        values = []
+        for s in group:
+            values.append(s.pos.x)
+            values.append(s.pos.y)
+            if extra:
+                values.append(extra(s))
+        return values
+
+    def compute(self):
+        g = self.game
+        p = g.player
+        pm = p.powerup_manager
+        h = {}
+
+        # Hash of the Mersenne Twister state tuple (ints hash the same every run)
+        h["rng"] = hash(random.getstate()[1]) & 0xFFFFFFFF
+
+        h["level"] = zlib.crc32(pack_floats([g.sim_clock.frame, g.level.timer, g.level.scroll_x]))
+
+        h["player"] = zlib.crc32(pack_floats([
+            p.pos.x, p.pos.y, float(p.alive()), float(p.invulnerable), p.invulnerable_timer,
+            p.speed_level, p.shoot_cooldown, p.missile_cooldown, len(p.options), len(p.shields),
+        ]))
+
+        aw = pm.active_weapons
+        h["powerups"] = zlib.crc32(pack_floats([
+            pm.meter_index, aw["missile"], aw["double"], aw["laser"], aw["option"], aw["shield"],
+        ]))
+
+        # Animation frame choice (Option pulse / Shield spin) + option positions
+        anim = []
+        for opt in p.options:
+            anim.extend((opt.rect.centerx, opt.rect.centery, opt.frames.index(opt.image) if opt.image in opt.frames else -1))
+        for s in p.shields:
+            steps = s.phase_frames[5 - s.hp] if s.phase_frames and 0 < s.hp <= 5 else []
+            anim.extend((s.hp, steps.index(s.image) if s.image in steps else -1))
+        h["anim"] = zlib.crc32(pack_floats(anim))
+
+        h["enemies"] = zlib.crc32(pack_floats(self.entity_values(g.enemy_group, lambda e: e.hp)))
+        h["bullets"] = zlib.crc32(pack_floats(self.entity_values(g.bullet_group)))
+        h["capsules"] = zlib.crc32(pack_floats(self.entity_values(g.capsule_group)))
+
+        eb = g.enemy_bullets
+        h["enemy_bullets"] = zlib.crc32(pack_floats([eb.t, len(eb.volleys), eb.live]))
+
+        chain = self.chain
+        for name in SUBSYSTEMS:
+            chain = zlib.crc32(struct.pack("I", h[name]), chain)
+        self.chain = chain
+        self.frame += 1
+        self.last = h
+        return chain, h
@@ -0,0 +1,41 @@
+import bisect
+from src.settings import INTERNAL_WIDTH, ACTIVATION_MARGIN
+
+class ActivationZone:
+    # Stage placements that haven't been reached yet.
+    # A dormant placement is only (stage_x, seq, spawn): the entity is created
+    # when the camera's right edge plus `margin` reaches stage_x, so dormant
+    # enemies cost nothing per frame (no update, collision or draw) no matter
+    # how long the stage is. Waking only ever looks at the front of the list.
+    def __init__(self, margin=ACTIVATION_MARGIN):
+        self.margin = margin
+        self.pending = [] # Sorted by stage_x; seq keeps insertion order for ties
+        self.seq = 0
+        self.woken = 0
+
+    @property
+    def wake_x(self):
+        # Screen x at which things wake
+        return INTERNAL_WIDTH + self.margin
+
+    def place(self, stage_x, spawn):
+        # spawn(screen_x) creates the entity when it wakes
+        bisect.insort(self.pending, (stage_x, self.seq, spawn))
+        self.seq += 1
+
+    def update(self, scroll_x):
+        edge = scroll_x + self.wake_x
+        pending = self.pending
+        n = 0
+        while n < len(pending) and pending[n][0] <= edge:
+            n += 1
+        if not n:
+            return
+        woken = pending[:n]
+        del pending[:n]
+        for stage_x, _seq, spawn in woken:
+            spawn(stage_x - scroll_x)
+        self.woken += n
+
+    def __len__(self):
+        return len(self.pending)
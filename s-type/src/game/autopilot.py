@@ -0,0 +1,100 @@
+from src.settings import INTERNAL_WIDTH, INTERNAL_HEIGHT
+
+class Autopilot:
+    # Plays the game through the same action dict InputHandler produces.
+    # Each frame it scores a set of horizontal lanes ahead of the ship
+    # (enemies, enemy bullets and terrain push away, capsules pull in)
+    # and steers toward the best one while holding fire.
+    def __init__(self, game, home_x=120, lanes=24, lookahead=300, margin=12):
+        self.game = game
+        self.home_x = home_x
+        self.lanes = lanes
+        self.lookahead = lookahead
+        self.margin = margin
+        self.pressed = False # 'powerup' is a just-pressed action, so release between presses
+        self.actions = {
+            'up': False, 'down': False, 'left': False, 'right': False,
+            'shoot': True, 'missile': True, 'shoot_both': False,
+            'powerup': False, 'debug_capsule': False,
+        }
+
+    def want_powerup(self):
+        pm = self.game.player.powerup_manager
+        if pm.meter_index < 0:
+            return False
+        label = pm.labels[pm.meter_index]
+        aw = pm.active_weapons
+        if label == "SPEED UP":
+            return self.game.player.speed_level < 2
+        if label == "MISSILE":
+            return not aw["missile"]
+        if label == "OPTION":
+            return aw["option"] < 4
+        if label == "?":
+            return not aw["shield"]
+        if label == "LASER":
+            return not aw["laser"]
+        return False
+
+    def update(self):
+        a = self.actions
+        g = self.game
+        p = g.player
+        a['up'] = a['down'] = a['left'] = a['right'] = False
+        a['powerup'] = False
+        if not p.alive():
+            return a
+
+        cx, cy = p.rect.center
+        half_h = p.rect.height // 2
+        left = max(0, p.rect.left)
+        right = min(INTERNAL_WIDTH, p.rect.right + self.lookahead)
+
+        # Vertical room over the stretch ahead
+        terrain = g.level.collision
+        top = terrain.lowest_ceiling(left, right) + half_h + self.margin
+        bottom = min(terrain.lowest_ground(left, right), INTERNAL_HEIGHT) - half_h - self.margin
+        if bottom < top:
+            top = bottom = (top + bottom) // 2
+
+        threats = [e.rect.center for e in g.enemy_group if e.rect.right > left - 40 and e.rect.left < right]
+        for pos in g.enemy_bullets.positions:
+            threats.extend(q for q in pos if q and left - 40 < q[0] < right)
+        capsules = [c.rect.center for c in g.capsule_group if c.rect.left < right]
+
+        best_y, best_score = cy, None
+        step = (bottom - top) / (self.lanes - 1) if self.lanes > 1 else 0
+        for i in range(self.lanes):
+            y = top + step * i
+            score = abs(y - cy) * 0.05 # Prefer small moves
+            for tx, ty in threats:
+                dx = max(1.0, abs(tx - cx))
+                dy = abs(ty - y)
+                if dy < 80:
+                    score += (80 - dy) * 400.0 / dx
+            for kx, ky in capsules:
+                score -= 3000.0 / (abs(ky - y) + 30) / max(1.0, abs(kx - cx) / 60)
+            if best_score is None or score < best_score:
+                best_y, best_score = y, score
+
+        dead_zone = p.current_speed
+        if best_y < cy - dead_zone:
+            a['up'] = True
+        elif best_y > cy + dead_zone:
+            a['down'] = True
+
+        # Hold a home column, drift forward for a nearby capsule
+        target_x = self.home_x
+        if capsules:
+            target_x = min(INTERNAL_WIDTH // 2, max(self.home_x, min(k[0] for k in capsules)))
+        if cx < target_x - dead_zone:
+            a['right'] = True
+        elif cx > target_x + dead_zone:
+            a['left'] = True
+
+        if not self.pressed and self.want_powerup():
+            a['powerup'] = True
+            self.pressed = True
+        else:
+            self.pressed = False
+        return a
@@ -0,0 +1,153 @@
+import pygame
+import math
+from src.settings import INTERNAL_WIDTH, INTERNAL_HEIGHT
+
+BULLET_RADIUS = 6 # 2 * 3
+
+class Volley:
+    # A group of bullets fired together. Nothing is integrated per frame:
+    # bullet i is at origin + velocity_i * (t - t0 - delay_i), evaluated on demand.
+    def __init__(self, origin, t0, vxs, vys, delays=None):
+        self.x0, self.y0 = origin
+        self.t0 = t0
+        self.vx = vxs
+        self.vy = vys
+        self.delay = delays if delays else [0] * len(vxs)
+        self.alive = [True] * len(vxs)
+        self.live_count = len(vxs)
+
+    def positions(self, t):
+        # Whole volley in one pass; None for bullets not emitted yet
+        age = t - self.t0
+        x0, y0 = self.x0, self.y0
+        return [
+            (x0 + vx * (age - d), y0 + vy * (age - d)) if alive and age >= d else None
+            for vx, vy, d, alive in zip(self.vx, self.vy, self.delay, self.alive)
+        ]
+
+
+# Pattern builders: each returns per-bullet velocity (and emission delay) arrays
+
+def direction_to(origin, target):
+    dx = target[0] - origin[0]
+    dy = target[1] - origin[1]
+    return math.atan2(dy, dx)
+
+def aimed(origin, target, speed):
+    a = direction_to(origin, target)
+    return [math.cos(a) * speed], [math.sin(a) * speed], None
+
+def spread(origin, target, count, arc, speed):
+    # count bullets fanned over arc (radians), centered on the target
+    a = direction_to(origin, target)
+    if count == 1:
+        angles = [a]
+    else:
+        angles = [a - arc / 2 + arc * i / (count - 1) for i in range(count)]
+    return [math.cos(b) * speed for b in angles], [math.sin(b) * speed for b in angles], None
+
+def ring(count, speed, phase=0.0):
+    angles = [phase + 2 * math.pi * i / count for i in range(count)]
+    return [math.cos(b) * speed for b in angles], [math.sin(b) * speed for b in angles], None
+
+def spiral(count, speed, turns=2.0, interval=2, phase=0.0):
+    # One bullet every `interval` frames, rotating `turns` times over the volley
+    step = 2 * math.pi * turns / count
+    angles = [phase + step * i for i in range(count)]
+    delays = [i * interval for i in range(count)]
+    return [math.cos(b) * speed for b in angles], [math.sin(b) * speed for b in angles], delays
+
+
+class EnemyBulletSystem:
+    # All enemy fire lives here as Volleys (not sprites).
+    # update() evaluates every volley once, culls off-screen bullets and
+    # tests the rest against the player hitbox and shields in the same pass.
+    def __init__(self):
+        self.volleys = []
+        self.t = 0
+        self.target = None # Player, linked by the Game
+
+        self.image = pygame.Surface((BULLET_RADIUS * 2, BULLET_RADIUS * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self.image, (255, 120, 200), (BULLET_RADIUS, BULLET_RADIUS), BULLET_RADIUS)
+        pygame.draw.circle(self.image, (255, 255, 255), (BULLET_RADIUS, BULLET_RADIUS), BULLET_RADIUS // 2)
+
+        self.positions = [] # Per volley [pos or None] from the last update, reused by blit_sequence()
+        self.live = 0
+
+    def fire(self, origin, pattern):
+        vxs, vys, delays = pattern
+        self.volleys.append(Volley(origin, self.t, vxs, vys, delays))
+
+    def fire_aimed(self, origin, speed=9.0):
+        if self.target and self.target.alive():
+            self.fire(origin, aimed(origin, self.target.rect.center, speed))
+
+    def fire_spread(self, origin, count=3, arc=0.5, speed=9.0):
+        if self.target and self.target.alive():
+            self.fire(origin, spread(origin, self.target.rect.center, count, arc, speed))
+
+    def hit_targets(self):
+        # Shield and player boxes as (left, top, right, bottom), grown by the
+        # bullet radius so each test is a point-in-box check
+        player = self.target
+        if not player or not player.alive():
+            return []
+        rects = [s.rect for s in player.shields if s.alive()]
+        if not player.invulnerable:
+            # Gradius-style small core hitbox
+            rects.append(player.rect.inflate(-player.rect.width // 2, -player.rect.height // 2))
+        r = BULLET_RADIUS
+        return [(b.left - r, b.top - r, b.right + r, b.bottom + r) for b in rects]
+
+    def update(self):
+        self.t += 1
+        boxes = self.hit_targets()
+        hits = 0
+
+        frame = []
+        self.live = 0
+        min_x, max_x = -BULLET_RADIUS, INTERNAL_WIDTH + BULLET_RADIUS
+        min_y, max_y = -BULLET_RADIUS, INTERNAL_HEIGHT + BULLET_RADIUS
+
+        for volley in self.volleys:
+            pos = volley.positions(self.t)
+            alive = volley.alive
+            for i, p in enumerate(pos):
+                if p is None:
+                    continue
+                x, y = p
+                if x < min_x or x > max_x or y < min_y or y > max_y:
+                    alive[i] = False
+                    volley.live_count -= 1
+                    pos[i] = None
+                    continue
+                hit = False
+                for left, top, right, bottom in boxes:
+                    if left <= x < right and top <= y < bottom:
+                        hit = True
+                        break
+                if hit:
+                    alive[i] = False
+                    volley.live_count -= 1
+                    pos[i] = None
+                    hits += 1
+                    continue
+                self.live += 1
+            if volley.live_count > 0:
+                frame.append((volley, pos))
+
+        # Retire spent volleys
+        if len(frame) != len(self.volleys):
+            self.volleys = [v for v, _ in frame]
+        self.positions = [pos for _, pos in frame]
+
+        for _ in range(hits):
+            if self.target.alive():
+                self.target.take_damage()
+
+    def blit_sequence(self):
+        if not self.live:
+            return []
+        img = self.image
+        r = BULLET_RADIUS
+        return [(img, (int(p[0]) - r, int(p[1]) - r)) for pos in self.positions for p in pos if p]
@@ -1,7 +1,10 @@
 import pygame
 from src.engine.entity import Entity
+from src.engine.render_queue import LAYER_CAPSULES
 
 class Capsule(Entity):
+    draw_layer = LAYER_CAPSULES
+
     def __init__(self, groups, x, y):
         super().__init__(groups, x, y)
         self.image.fill((255, 0, 0)) # Red
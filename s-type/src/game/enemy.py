@@ -1,4 +1,5 @@
 import pygame
+import math
 from src.engine.entity import Entity
 from src.settings import INTERNAL_WIDTH, INTERNAL_HEIGHT
 
@@ -7,22 +8,51 @@ class Enemy(Entity):
         super().__init__(groups, x, y)
         self.hp = hp
         self.image.fill((200, 50, 50)) # Generic Red Enemy
+        self.destroyed = False # Killed by the player (vs. leaving the screen)
+        self.formation = None
         
     def take_damage(self, amount):
         self.hp -= amount
         if self.hp <= 0:
+            self.destroyed = True
             self.kill()
 
 class Walker(Enemy):
-    def __init__(self, groups, x, y):
+    FIRE_INTERVAL = 90
+    
+    def __init__(self, groups, x, y, terrain=None, bullets=None):
         super().__init__(groups, x, y, hp=1)
         self.image.fill((150, 150, 150)) # Grey Walker
         self.image = pygame.transform.scale(self.image, (48, 48)) # 16 * 3
         self.rect = self.image.get_rect(topleft=(x, y))
         self.vel = pygame.math.Vector2(-3, 0) # -1 * 3
+        self.terrain = terrain
+        if terrain:
+            self.stick_to_ground()
+        
+        # Enemy fire (EnemyBulletSystem): aimed shots, every third volley a 3-way spread
+        self.bullets = bullets
+        self.fire_timer = self.FIRE_INTERVAL // 2
+        self.shots_fired = 0
+        
+    def stick_to_ground(self):
+        # Walk along the floor surface (steps up walls, follows slopes down)
+        self.rect.bottom = self.terrain.ground_at(self.rect.centerx)
+        self.pos.y = self.rect.top
         
     def update(self, *args):
         super().update(*args)
+        if self.terrain:
+            self.stick_to_ground()
+        if self.bullets and 0 < self.rect.centerx < INTERNAL_WIDTH:
+            self.fire_timer -= 1
+            if self.fire_timer <= 0:
+                self.fire_timer = self.FIRE_INTERVAL
+                self.shots_fired += 1
+                if self.shots_fired % 3 == 0:
+                    self.bullets.fire_spread(self.rect.midtop)
+                else:
+                    self.bullets.fire_aimed(self.rect.midtop)
         if self.rect.right < 0:
             self.kill()
 
@@ -37,7 +67,8 @@ class Fan(Enemy): # The flying ones that come in waves
         self.t = 0
     
     def update(self, *args):
-        import math
+        if self.formation:
+            return # Positioned by its Formation
         self.t += 0.1
         self.vel.y = math.sin(self.t + self.wave_offset) * 4.5 # 1.5 * 3
         super().update(*args)
@@ -0,0 +1,97 @@
+import math
+from src.settings import INTERNAL_WIDTH, ACTIVATION_MARGIN
+from src.game.enemy import Fan
+from src.game.capsule import Capsule
+
+# Shared path tables, keyed by (amplitude, step, length)
+_path_cache = {}
+
+def sine_path(amplitude, step, length):
+    # Cumulative vertical offset of a sine-wave flyer:
+    # table[n] = sum(amplitude * sin(step * k) for k in 1..n)
+    key = (amplitude, step, length)
+    table = _path_cache.get(key)
+    if table is None:
+        table = [0.0] * length
+        y = 0.0
+        for n in range(1, length):
+            y += math.sin(step * n) * amplitude
+            table[n] = y
+        _path_cache[key] = table
+    return table
+
+class Formation:
+    # Drives a whole wave of Fans from one clock and one path table.
+    # Member i trails the leader by `spacing` px and `phase_steps` steps of the wave;
+    # its position at frame n is (x0 + i * spacing - speed * n, y0 + path[n + ph] - path[ph]),
+    # the same motion a standalone Fan integrates frame by frame.
+    # Destroying every member drops a capsule where the last one died.
+    # Members trailing beyond the activation margin stay dormant (in no group)
+    # until the formation's clock brings them within it.
+    def __init__(self, groups, capsule_groups, x, y, count=5, spacing=60, speed=6, phase_steps=5,
+                 amplitude=4.5, step=0.1, margin=ACTIVATION_MARGIN):
+        self.groups = groups
+        self.capsule_groups = capsule_groups
+        self.wake_x = INTERNAL_WIDTH + margin
+        self.speed = speed
+        self.x0 = x
+        self.y0 = y
+        self.frame = 0
+
+        # Long enough for the last member to cross the whole screen
+        self.lifetime = int((INTERNAL_WIDTH + spacing * count + 64) / speed) + 1
+        self.path = sine_path(amplitude, step, self.lifetime + phase_steps * count + 1)
+
+        self.members = []
+        self.dormant = [] # Ordered by offset, so they wake front to back
+        for i in range(count):
+            awake = x + i * spacing <= self.wake_x
+            fan = Fan(groups if awake else [], x + i * spacing, y, i * phase_steps * step)
+            fan.formation = self
+            fan.offset_x = i * spacing
+            fan.phase = i * phase_steps
+            (self.members if awake else self.dormant).append(fan)
+
+        self.count = count
+        self.destroyed = 0
+        self.escaped = 0
+        self.last_kill_pos = None
+        self.done = False
+
+    def update(self):
+        self.frame += 1
+        n = min(self.frame, self.lifetime)
+        path = self.path
+        x_base = self.x0 - self.speed * n
+
+        while self.dormant and x_base + self.dormant[0].offset_x <= self.wake_x:
+            fan = self.dormant.pop(0)
+            fan.add(self.groups)
+            self.members.append(fan)
+
+        remaining = []
+        for fan in self.members:
+            if not fan.alive():
+                if fan.destroyed:
+                    self.destroyed += 1
+                    self.last_kill_pos = fan.rect.center
+                else:
+                    self.escaped += 1
+                continue
+            x = x_base + fan.offset_x
+            y = self.y0 + path[n + fan.phase] - path[fan.phase]
+            fan.pos.update(x, y)
+            fan.rect.topleft = (x, y)
+            if fan.rect.right < 0:
+                fan.kill()
+                self.escaped += 1
+                continue
+            remaining.append(fan)
+        self.members = remaining
+
+        if not self.members and not self.dormant:
+            # Classic rule: whole wave destroyed -> capsule
+            if self.destroyed == self.count and self.last_kill_pos:
+                Capsule(self.capsule_groups, self.last_kill_pos[0], self.last_kill_pos[1])
+                print("Wave Destroyed! Capsule dropped.")
+            self.done = True
@@ -1,7 +1,13 @@
 import pygame
 import random
+from itertools import islice
 from src.settings import INTERNAL_WIDTH, INTERNAL_HEIGHT
-from src.game.enemy import Walker, Fan
+from src.engine.render_queue import LAYER_BACKGROUND, LAYER_TERRAIN
+from src.game.enemy import Walker
+from src.game.formation import Formation
+from src.game.activation import ActivationZone
+from src.game.terrain import TileMap, TerrainRenderer, TerrainIndex, TILE_SIZE
+from src.game.stage_data import STAGE_1_PROFILE, STAGE_1_ENEMIES
 
 class Level:
     def __init__(self, game):
@@ -10,46 +16,94 @@ class Level:
         
         # Background
         self.bg_color = (20, 10, 5) # Dark sandy space
-        self.scroll_x = 0
-        self.scroll_speed = 0.5
+        self.scroll_x = 0 # Camera position in stage pixels (drives terrain streaming)
+        self.scroll_speed = 1.5 # 0.5 * 3
+        
+        # Active enemy waves
+        self.formations = []
+        self.waves = 0 # Waves spawned so far (memory snapshots are taken per wave)
+        
+        # Terrain
+        self.tilemap = TileMap.from_profile(STAGE_1_PROFILE)
+        self.terrain = TerrainRenderer(self.tilemap)
+        self.collision = TerrainIndex(self.tilemap)
+        
+        # Pre-placed enemies sleep until the camera comes within the margin
+        self.activation = ActivationZone()
+        self.spawners = {"walker": self.spawn_walker}
+        self.placed_until = 0 # Stage x up to which the enemy layout has been queued
         
         # Stars / Sand particles
+        # One small pre-drawn dot blitted per star (works with both renderers).
+        # Own RNG: the QualityGovernor changes how many stars move, which must not
+        # shift the seeded game RNG.
+        self.star_rng = random.Random(0)
+        self.star_image = pygame.Surface((3, 3), pygame.SRCALPHA)
+        pygame.draw.circle(self.star_image, (200, 180, 150), (1, 1), 1)
         self.stars = []
         for _ in range(50):
-            self.stars.append([random.randint(0, INTERNAL_WIDTH), random.randint(0, INTERNAL_HEIGHT), random.choice([0.5, 1, 2])])
+            self.stars.append([self.star_rng.randint(0, INTERNAL_WIDTH), self.star_rng.randint(0, INTERNAL_HEIGHT), self.star_rng.choice([0.5, 1, 2])])
+        self.active_stars = len(self.stars) # Lowered by the QualityGovernor under load
 
     def update(self):
         self.timer += 1
         self.scroll_background()
+        if self.scroll_x + self.activation.wake_x >= self.placed_until:
+            self.place_stage_enemies()
+        self.activation.update(self.scroll_x)
         self.spawn_enemies()
+        
+        for formation in self.formations:
+            formation.update()
+        if any(f.done for f in self.formations):
+            self.formations = [f for f in self.formations if not f.done]
 
     def scroll_background(self):
-        self.scroll_x -= self.scroll_speed
-        if self.scroll_x <= -INTERNAL_WIDTH:
-            self.scroll_x = 0
+        self.scroll_x += self.scroll_speed
+        self.terrain.update(self.scroll_x)
+        self.collision.scroll_x = self.scroll_x
             
-        for star in self.stars:
+        for star in islice(self.stars, self.active_stars):
             star[0] -= star[2] # Move by speed
             if star[0] < 0:
                 star[0] = INTERNAL_WIDTH
-                star[1] = random.randint(0, INTERNAL_HEIGHT)
+                star[1] = self.star_rng.randint(0, INTERNAL_HEIGHT)
 
     def draw_background(self, surface):
         surface.fill(self.bg_color)
-        
+
+    def submit(self, queue):
         # Draw "Stars" / Sand grains
-        for star in self.stars:
-            pygame.draw.circle(surface, (200, 180, 150), (int(star[0]), int(star[1])), 1)
+        img = self.star_image
+        queue.submit_many(LAYER_BACKGROUND, [(img, (int(star[0]) - 1, int(star[1]) - 1))
+                                             for star in islice(self.stars, self.active_stars)])
+        
+        # Terrain (a few cached chunk blits regardless of stage length)
+        queue.submit_many(LAYER_TERRAIN, self.terrain.blit_sequence(self.scroll_x))
+
+    def place_stage_enemies(self):
+        # Queue the next loop of the enemy layout (the demo stage repeats with its terrain)
+        for col, kind in STAGE_1_ENEMIES:
+            self.activation.place(self.placed_until + col * TILE_SIZE, self.spawners[kind])
+        self.placed_until += self.tilemap.pixel_width
+
+    def spawn_walker(self, x):
+        Walker([self.game.all_sprites, self.game.enemy_group], x, INTERNAL_HEIGHT - 90, terrain=self.collision, bullets=self.game.enemy_bullets)
+
+    def dormant_count(self):
+        return len(self.activation) + sum(len(f.dormant) for f in self.formations)
+
+    def debug_lines(self):
+        return [f"ACTIVATION margin {self.activation.margin}  active {len(self.game.enemy_group)}  "
+                f"dormant {self.dormant_count()}  woken {self.activation.woken}"]
 
     def spawn_enemies(self):
         # Very simple spawn script for demo
         # Wave of Fans every 200 frames
         if self.timer % 200 == 0:
-            for i in range(5):
-                offset_x = i * 60 # 20 * 3
-                Fan([self.game.all_sprites, self.game.enemy_group], INTERNAL_WIDTH + offset_x, INTERNAL_HEIGHT // 2, i * 0.5)
-        
-        # Walkers on the "floor" randomly
-        if self.timer % 150 == 0:
-             if random.random() > 0.5:
-                 Walker([self.game.all_sprites, self.game.enemy_group], INTERNAL_WIDTH, INTERNAL_HEIGHT - 90) # Floor buffer scaled
+            self.formations.append(Formation(
+                [self.game.all_sprites, self.game.enemy_group],
+                [self.game.all_sprites, self.game.capsule_group],
+                INTERNAL_WIDTH, INTERNAL_HEIGHT // 2, count=5, spacing=60)) # 20 * 3
+            self.waves += 1
+        # Walkers are pre-placed (STAGE_1_ENEMIES) and woken by the ActivationZone
@@ -0,0 +1,9 @@
+from src.game.sprite_factory import resource_path
+from src.game.sound_bank import sound_manifest
+
+# Everything the game needs before the first frame.
+# Decoded by the AssetLoader on a worker thread during the loading screen.
+ASSET_MANIFEST = [
+    ("image", "master_sheet", resource_path("assets/sprites/gradius_sheet_v3.png")),
+    ("font", "hud", ("arial", 24)), # 8 * 3
+] + sound_manifest()
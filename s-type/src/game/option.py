@@ -1,10 +1,13 @@
 import pygame
 from src.engine.entity import Entity
+from src.engine.render_queue import LAYER_OPTIONS
 from src.settings import INTERNAL_WIDTH, INTERNAL_HEIGHT
 from src.game.weapons import NormalShot, Missile, Double, Laser
-from src.game.sprite_factory import SpriteGenerator, OPTION_PALETTE, OPTION_GRID
+from src.game.sprite_factory import compile_sprite, OPTION_PALETTE, OPTION_GRID
 
 class Option(Entity):
+    draw_layer = LAYER_OPTIONS
+    
     def __init__(self, groups, x, y, player, delay_frames=15, bullet_groups=None):
         super().__init__(groups, x, y)
         
@@ -29,7 +32,7 @@ class Option(Entity):
              
              self.image = self.frames[2] # Start Full
         else:
-             self.image = SpriteGenerator.create_sprite(OPTION_GRID, OPTION_PALETTE, scale=6) 
+             self.image = compile_sprite(OPTION_GRID, OPTION_PALETTE, scale=6) # Shared, never mutated
              self.frames = []
              
         self.rect = self.image.get_rect(center=(x, y))
@@ -40,6 +43,14 @@ class Option(Entity):
         # If no specific bullet groups passed, fallback to Entity groups
         self.bullet_groups = bullet_groups if bullet_groups else groups
         
+    def reset(self, x, y):
+        # Called when a pooled Option is re-earned after the player died
+        if self.frames:
+            self.image = self.frames[2]
+        self.rect = self.image.get_rect(center=(x, y))
+        self.pos.update(self.rect.topleft)
+        self.animation_timer = 0
+
     def update(self, *args):
         # Do NOT call super().update()! 
         # Entity.update forces rect to match self.pos (physics).
@@ -47,10 +58,8 @@ class Option(Entity):
         
         # Pulse Animation
         if self.frames:
-            # Sync all options to global time so they pulse together
-            # Approx 60 FPS = ~16ms per frame.
-            current_frame = pygame.time.get_ticks() // 16
-            cycle = current_frame % 16
+            # Sync all options to the simulation clock so they pulse together
+            cycle = self.player.clock.frame % 16
             
             frame_idx = 0
             if cycle < 4:
@@ -86,4 +95,4 @@ class Option(Entity):
         cx = self.rect.centerx
         bg = self.bullet_groups
         if active_weapons["missile"]:
-            Missile(bg, cx, self.rect.bottom)
+            Missile(bg, cx, self.rect.bottom, terrain=self.player.terrain)
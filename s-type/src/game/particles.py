@@ -0,0 +1,110 @@
+import pygame
+import math
+import random
+
+# Explosion look: frame index follows remaining life (bright and big -> dark and small)
+PARTICLE_FRAMES = [
+    ((90, 20, 10), 2),
+    ((200, 60, 20), 3),
+    ((255, 140, 30), 4),
+    ((255, 230, 120), 6),
+]
+
+class ParticleSystem:
+    # Particles live in preallocated parallel lists, not sprites.
+    # Live particles are packed into [0, count); dead ones are swap-removed.
+    # Drawing is a blit sequence over cached frames (submitted to the RenderQueue).
+    # Own RNG: particles are cosmetic, so how many get emitted (emit cap, capacity)
+    # must never shift the seeded game RNG.
+    def __init__(self, capacity=4096, emit_cap=600, directions=64, seed=0):
+        self.capacity = capacity
+        self.emit_cap = emit_cap # Max particles spawned per frame (rest are dropped)
+        self.count = 0
+        self.rng = random.Random(seed)
+
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.life = [0] * capacity
+        self.max_life = [1] * capacity
+
+        # Unit vectors so emitting needs no trig
+        self.directions = [(math.cos(a * 2 * math.pi / directions), math.sin(a * 2 * math.pi / directions)) for a in range(directions)]
+
+        self.frames = []
+        for color, size in PARTICLE_FRAMES:
+            surf = pygame.Surface((size, size))
+            surf.fill(color)
+            self.frames.append((surf, size // 2))
+
+        # Per-frame stats
+        self.emitted = 0
+        self.dropped = 0
+        self.budget = emit_cap
+
+    def emit(self, x, y, amount, speed=6.0, life=30):
+        allowed = min(amount, self.budget, self.capacity - self.count)
+        self.budget -= allowed
+        self.emitted += allowed
+        self.dropped += amount - allowed
+
+        dirs = self.directions
+        n_dirs = len(dirs)
+        rng = self.rng
+        for _ in range(allowed):
+            i = self.count
+            dx, dy = dirs[rng.randrange(n_dirs)]
+            s = speed * (0.3 + rng.random() * 0.7)
+            self.x[i] = x
+            self.y[i] = y
+            self.vx[i] = dx * s
+            self.vy[i] = dy * s
+            ttl = life // 2 + rng.randrange(life // 2 + 1)
+            self.life[i] = ttl
+            self.max_life[i] = ttl
+            self.count += 1
+
+    def explode(self, rect, amount=24, speed=6.0):
+        self.emit(rect.centerx, rect.centery, amount, speed)
+
+    def update(self):
+        # New frame: reset emission budget and stats
+        self.budget = self.emit_cap
+        self.emitted = 0
+        self.dropped = 0
+
+        x, y, vx, vy, life, max_life = self.x, self.y, self.vx, self.vy, self.life, self.max_life
+        i = 0
+        count = self.count
+        while i < count:
+            life[i] -= 1
+            if life[i] <= 0:
+                # Swap-remove with the last live particle
+                count -= 1
+                x[i] = x[count]
+                y[i] = y[count]
+                vx[i] = vx[count]
+                vy[i] = vy[count]
+                life[i] = life[count]
+                max_life[i] = max_life[count]
+                continue
+            x[i] += vx[i]
+            y[i] += vy[i]
+            vx[i] *= 0.94 # Drag
+            vy[i] *= 0.94
+            i += 1
+        self.count = count
+
+    def blit_sequence(self):
+        if not self.count:
+            return []
+        frames = self.frames
+        top = len(frames) - 1
+        x, y, life, max_life = self.x, self.y, self.life, self.max_life
+
+        batch = []
+        for i in range(self.count):
+            img, half = frames[life[i] * top // max_life[i]]
+            batch.append((img, (int(x[i]) - half, int(y[i]) - half)))
+        return batch
@@ -1,5 +1,6 @@
 import pygame
 from src.engine.entity import Entity
+from src.engine.render_queue import LAYER_PLAYER
 from src.settings import INTERNAL_WIDTH, INTERNAL_HEIGHT
 from src.game.powerup_manager import PowerUpManager
 from src.game.weapons import NormalShot, Missile, Double, Laser
@@ -8,6 +9,8 @@ from src.game.shield import Shield
 from src.game.sprite_factory import SpriteGenerator, VIC_VIPER_PALETTE, VIC_VIPER_GRID
 
 class Player(Entity):
+    draw_layer = LAYER_PLAYER
+
     def __init__(self, groups, x, y):
         super().__init__(groups, x, y)
         # Try loading master sheet
@@ -41,33 +44,74 @@ class Player(Entity):
             self.image = SpriteGenerator.create_sprite(VIC_VIPER_GRID, VIC_VIPER_PALETTE, scale=6) # 2*3 = 6
             self.images = []
             
-        self.rect = self.image.get_rect(topleft=(x, y))
-        self.pos = pygame.math.Vector2(x, y)
-        
         # Movement stats
         self.base_speed = 6.0 # 2.0 * 3
-        self.speed_level = 0
         self.max_speed_level = 5
-        self.current_speed = self.base_speed
         
         # Systems
         self.powerup_manager = PowerUpManager(self)
         self.bullet_groups = groups # Use same groups for now, or separate
-        self.shoot_cooldown = 0
-        self.missile_cooldown = 0
+        self.spawn_groups = groups # Re-joined on respawn
+        self.terrain = None # TerrainIndex, linked by the Game
+        self.audio = None # AudioSystem, linked by the Game
+        self.clock = None # SimClock, linked by the Game (Option / Shield animation)
         
         # Options
         self.options = [] # List of Option entities
         self.shields = [] # List of Shield entities
+        self.option_pool = [] # Killed Options kept for reuse (no sheet reload when re-earned)
+        self.shield_pool = [] # Same for Shields
         self.position_trace = [] # History of (x, y) tuples
         self.max_trace_length = 100 
         
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        # Restore spawn state in place. The sprite sheet frames, PowerUpManager
+        # and pooled Options/Shields are all kept, so respawning allocates nothing.
+        if self.images:
+            for img in self.images:
+                img.set_alpha(255)
+            self.image = self.images[2]
+        self.image.set_alpha(255)
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self.pos.update(x, y)
+        self.vel.update(0, 0)
+        
+        self.speed_level = 0
+        self.current_speed = self.base_speed
+        self.shoot_cooldown = 0
+        self.missile_cooldown = 0
+        
+        self.powerup_manager.reset()
+        self.release_options()
+        self.release_shields()
+        self.position_trace.clear()
+        
         # Invulnerability
         self.invulnerable = False
         self.invulnerable_timer = 0
         self.flash_timer = 0
         self.visible = True
 
+    def respawn(self, x, y):
+        self.reset(x, y)
+        self.add(self.spawn_groups)
+
+    def release_options(self):
+        for opt in self.options:
+            if opt.alive():
+                opt.kill()
+        self.option_pool.extend(self.options)
+        self.options.clear()
+
+    def release_shields(self):
+        for s in self.shields:
+            if s.alive():
+                s.kill()
+        self.shield_pool.extend(self.shields)
+        self.shields.clear()
+
     def activate_invulnerability(self, duration):
         self.invulnerable = True
         self.invulnerable_timer = duration
@@ -101,9 +145,9 @@ class Player(Entity):
         if self.missile_cooldown > 0:
             self.missile_cooldown -= 1
             
-        # Invulnerability Logic
+        # Invulnerability Logic (delta_time = simulated ms per frame)
         if self.invulnerable:
-            dt = delta_time * 16 # Approx ms
+            dt = delta_time
             self.invulnerable_timer -= dt
             
             # Flash effect
@@ -188,6 +232,8 @@ class Player(Entity):
 
     def fire_primary(self):
         # Logic for Laser vs Double vs Normal
+        if self.audio:
+            self.audio.play("laser" if self.powerup_manager.active_weapons["laser"] else "shot")
         if self.powerup_manager.active_weapons["laser"]:
             Laser(self.bullet_groups, self.rect.right, self.rect.centery)
         elif self.powerup_manager.active_weapons["double"]:
@@ -198,7 +244,9 @@ class Player(Entity):
 
     def fire_missile(self):
         missile_groups = self.bullet_groups
-        Missile(missile_groups, self.rect.centerx, self.rect.bottom)
+        if self.audio:
+            self.audio.play("missile")
+        Missile(missile_groups, self.rect.centerx, self.rect.bottom, terrain=self.terrain)
 
     def speed_up(self):
         if self.speed_level < self.max_speed_level:
@@ -214,12 +262,19 @@ class Player(Entity):
         if len(self.options) < 4:
             # Spawn option using same groups as player context
             # Pass bullet_groups so Option shots can kill enemies
-            opt = Option(self.groups(), self.rect.centerx, self.rect.centery, self, bullet_groups=self.bullet_groups)
+            if self.option_pool:
+                opt = self.option_pool.pop()
+                opt.reset(self.rect.centerx, self.rect.centery)
+                opt.add(self.groups())
+            else:
+                opt = Option(self.groups(), self.rect.centerx, self.rect.centery, self, bullet_groups=self.bullet_groups)
             self.options.append(opt)
             print(f"Option added! Total: {len(self.options)}")
     
     def activate_shield(self):
         # Only activate if no shields present
+        # Exhausted shields go back to the pool
+        self.shield_pool.extend(s for s in self.shields if not s.alive())
         self.shields = [s for s in self.shields if s.alive()]
         
         if len(self.shields) == 0:
@@ -227,19 +282,20 @@ class Player(Entity):
             # Spawn 1 shield blob in front with HD Offsets
             # User requested distinct single sprite closer to nose.
             # Reduced offset_x from 54 to 15.
-            s1 = Shield(self.groups(), self.rect.right + 15, self.rect.centery, self, offset_x=15)
+            if self.shield_pool:
+                s1 = self.shield_pool.pop()
+                s1.reset(self.rect.right + 15, self.rect.centery)
+                s1.add(self.groups())
+            else:
+                s1 = Shield(self.groups(), self.rect.right + 15, self.rect.centery, self, offset_x=15)
             self.shields.append(s1)
         else:
             print("Shield already active!")
 
     def kill(self):
-        # Cleanup dependent entities
-        for opt in self.options:
-            if opt.alive():
-                opt.kill()
-        for s in self.shields:
-            if s.alive():
-                s.kill()
+        # Cleanup dependent entities (kept in the pools for reuse)
+        self.release_options()
+        self.release_shields()
         super().kill()
 
     def recharge_shield(self):
@@ -268,6 +324,44 @@ class Player(Entity):
             
         self.pos = pygame.math.Vector2(self.rect.topleft) # Sync floating point pos back if clamped
 
+    def terrain_hitbox(self):
+        # Hitbox is smaller than the sprite (transparent margins around the ship)
+        return self.rect.inflate(-self.rect.width // 3, -self.rect.height // 2)
+
+    def hits_terrain(self):
+        if not self.terrain:
+            return False
+        return self.terrain.rect_hits(self.terrain_hitbox())
+
+    def push_out_of_terrain(self, max_push=48):
+        # Rock stays solid while invulnerable: move the ship by the smallest
+        # offset that clears it (onto the floor / under the ceiling, or back in
+        # front of a wall). Returns False if nothing within reach is open.
+        hitbox = self.terrain_hitbox()
+        best = None
+        left = max(0, hitbox.left)
+        right = min(INTERNAL_WIDTH, hitbox.right)
+        floor = self.terrain.lowest_ground(left, right)
+        ceiling = self.terrain.lowest_ceiling(left, right)
+        if floor - ceiling >= hitbox.height:
+            if hitbox.bottom > floor:
+                best = (0, floor - hitbox.bottom)
+            elif hitbox.top < ceiling:
+                best = (0, ceiling - hitbox.top)
+        for dx in range(1, max_push + 1):
+            if best and dx >= abs(best[1]):
+                break
+            if hitbox.left - dx < 0:
+                break
+            if not self.terrain.rect_hits(hitbox.move(-dx, 0)):
+                best = (-dx, 0)
+                break
+        if best is None:
+            return False
+        self.rect.move_ip(best)
+        self.pos = pygame.math.Vector2(self.rect.topleft)
+        return True
+
     def take_damage(self):
         # Check for active shields
         active_shields = [s for s in self.shields if s.alive()]
@@ -16,6 +16,17 @@ class PowerUpManager:
             "shield": False
         }
 
+    def reset(self):
+        # Back to an empty bar. Mutates in place so the UI keeps a valid reference.
+        self.meter_index = -1
+        self.active_weapons.update({
+            "missile": False,
+            "double": False,
+            "laser": False,
+            "option": 0,
+            "shield": False
+        })
+
     def collect_capsule(self):
         self.meter_index = (self.meter_index + 1) % len(self.labels)
         print(f"PowerUp Bar: {self.labels[self.meter_index]}")
@@ -65,6 +76,8 @@ class PowerUpManager:
             
         # Reset meter logic ONLY if successful use
         if success:
+            if self.player.audio:
+                self.player.audio.play("powerup")
             self.meter_index = -1
             print(f"Activated: {selected}")
         else:
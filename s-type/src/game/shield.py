@@ -1,7 +1,10 @@
 import pygame
 from src.engine.entity import Entity
+from src.engine.render_queue import LAYER_SHIELDS
 
 class Shield(Entity):
+    draw_layer = LAYER_SHIELDS
+    
     def __init__(self, groups, x, y, player, offset_x=36, hp=5):
         super().__init__(groups, x, y)
         self.player = player
@@ -35,9 +38,32 @@ class Shield(Entity):
              pygame.draw.circle(self.image, (0, 100, 255, 180), (9, 18), 9)
              self.image = pygame.transform.scale(self.image, (18, 36))
              self.phase_sprites = []
+        
+        # Pre-build the 4 animation steps per phase so update() never flips/rotates
+        self.phase_frames = [self.build_steps(sprites) for sprites in self.phase_sprites]
              
         self.rect = self.image.get_rect(center=(x, y))
+
+    def build_steps(self, sprites):
+        if len(sprites) == 2:
+            # Pair Logic: LR, UD, LR(Inv), UD(Inv)
+            return [
+                sprites[0],
+                sprites[1],
+                pygame.transform.flip(sprites[0], True, False), # Flip X
+                pygame.transform.flip(sprites[1], False, True), # Flip Y
+            ]
+        # Single Logic: Rot 0, 90, 180, 270
+        return [pygame.transform.rotate(sprites[0], step * 90) for step in range(4)]
         
+    def reset(self, x, y, hp=5):
+        # Called when a pooled Shield is re-deployed
+        self.hp = hp
+        if self.phase_sprites:
+            self.image = self.phase_sprites[0][0]
+        self.rect = self.image.get_rect(center=(x, y))
+        self.pos.update(self.rect.topleft)
+
     def update(self, *args):
         # Do NOT call super().update()!
         
@@ -54,26 +80,11 @@ class Shield(Entity):
             if phase_idx < 0: phase_idx = 0
             if phase_idx >= len(self.phase_sprites): phase_idx = len(self.phase_sprites) - 1
             
-            sprites = self.phase_sprites[phase_idx]
-            
-            # Animation Timer (Global Sync)
-            tick = pygame.time.get_ticks() // 100 
+            # Animation Timer (simulation clock, shared by all shields)
+            tick = int(self.player.clock.ms // 100)
             step = tick % 4
             
-            if len(sprites) == 2:
-                # Pair Logic: LR, UD, LR(Inv), UD(Inv)
-                if step == 0:
-                    self.image = sprites[0]
-                elif step == 1:
-                    self.image = sprites[1]
-                elif step == 2:
-                    self.image = pygame.transform.flip(sprites[0], True, False) # Flip X
-                elif step == 3:
-                    self.image = pygame.transform.flip(sprites[1], False, True) # Flip Y
-            else:
-                # Single Logic: Rot 0, 90, 180, 270
-                angle = step * 90
-                self.image = pygame.transform.rotate(sprites[0], angle)
+            self.image = self.phase_frames[phase_idx][step]
             
             # Re-center
             self.rect = self.image.get_rect(center=self.rect.center)
@@ -0,0 +1,75 @@
+import math
+import random
+import array
+import pygame
+from src.settings import AUDIO_FREQUENCY
+
+# Procedural sound effects (no audio files shipped).
+# Each builder returns raw signed 16-bit PCM for the mixer's actual format,
+# so decoding happens once during the loading screen instead of at trigger time.
+
+def mixer_format():
+    init = pygame.mixer.get_init()
+    if init is None:
+        return AUDIO_FREQUENCY, 1
+    frequency, _size, channels = init
+    return frequency, channels
+
+def render(samples, channels):
+    # Float samples (-1..1) -> interleaved int16 bytes
+    pcm = array.array("h", (int(max(-1.0, min(1.0, s)) * 32767) for s in samples))
+    if channels > 1:
+        wide = array.array("h")
+        for s in pcm:
+            wide.extend([s] * channels)
+        pcm = wide
+    return pcm.tobytes()
+
+def sweep(start_hz, end_hz, ms, volume=0.5, square=True):
+    # Pitch slide with a linear fade-out (shots, pickups)
+    frequency, channels = mixer_format()
+    n = int(frequency * ms / 1000)
+    phase = 0.0
+    samples = []
+    for i in range(n):
+        t = i / n
+        phase += (start_hz + (end_hz - start_hz) * t) / frequency
+        wave = 1.0 if phase % 1.0 < 0.5 else -1.0
+        if not square:
+            wave = math.sin(phase * 2 * math.pi)
+        samples.append(wave * volume * (1.0 - t))
+    return render(samples, channels)
+
+def noise(ms, volume=0.6, hold=4, seed=0):
+    # Sample-and-hold noise with an exponential decay (explosions).
+    # Own RNG so loading sounds never disturbs the seeded game RNG.
+    frequency, channels = mixer_format()
+    rng = random.Random(seed)
+    n = int(frequency * ms / 1000)
+    samples = []
+    value = 0.0
+    for i in range(n):
+        if i % hold == 0:
+            value = rng.uniform(-1.0, 1.0)
+        samples.append(value * volume * math.exp(-4.0 * i / n))
+    return render(samples, channels)
+
+def arpeggio(notes_hz, note_ms, volume=0.4):
+    # Rising square-wave jingle (power-up activation)
+    return b"".join(sweep(hz, hz, note_ms, volume) for hz in notes_hz)
+
+
+# name -> (category, builder)
+SOUND_BANK = {
+    "shot":      ("shot", lambda: sweep(1400, 600, 60, 0.25)),
+    "laser":     ("shot", lambda: sweep(2200, 1800, 90, 0.2, square=False)),
+    "missile":   ("shot", lambda: sweep(300, 120, 120, 0.3)),
+    "explosion": ("explosion", lambda: noise(350, 0.5, hold=6, seed=1)),
+    "player_explosion": ("explosion", lambda: noise(900, 0.7, hold=12, seed=2)),
+    "capsule":   ("powerup", lambda: sweep(600, 1200, 80, 0.3)),
+    "powerup":   ("powerup", lambda: arpeggio([523, 659, 784, 1047], 50)),
+}
+
+def sound_manifest():
+    # AssetLoader entries for every effect
+    return [("sound", name, builder) for name, (_category, builder) in SOUND_BANK.items()]
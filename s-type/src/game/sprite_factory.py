@@ -1,6 +1,9 @@
 import pygame
 import sys
 import os
+import hashlib
+from src.engine import assets
+from src.settings import SPRITE_CACHE_DIR
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -12,33 +15,109 @@ def resource_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 
+def cache_dir():
+    """ Writable sprite cache folder: next to the project, or the user cache dir for a built exe """
+    if getattr(sys, "frozen", False):
+        # A one-file build unpacks to a temp folder, and the working directory is wherever it was launched
+        if os.name == "nt":
+            base_path = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        else:
+            base_path = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        return os.path.join(base_path, "s-type", SPRITE_CACHE_DIR.lstrip("."))
+    project = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project, SPRITE_CACHE_DIR)
+
 def load_master_sheet():
+    # Normally preloaded by the AssetLoader; only hits the disk once if it wasn't
+    sheet = assets.get_image("master_sheet")
+    if sheet or assets.is_missing("master_sheet"):
+        return sheet
     try:
         # V3 (Centrally Aligned)
         # Use resource_path to find the file in the bundle
         path = resource_path("assets/sprites/gradius_sheet_v3.png")
-        sheet = pygame.image.load(path).convert_alpha()
+        sheet = assets.prepare_image(pygame.image.load(path))
+        assets.store_image("master_sheet", sheet)
         return sheet
     except FileNotFoundError:
         print(f"Error: Could not find sprite sheet at {path}")
+        assets.mark_missing("master_sheet")
         return None
 
+# Scaled sheet frames shared by every instance (projectiles spawn constantly).
+# Shared frames must not be mutated (no set_alpha / fill on them).
+_frame_cache = {}
+
+def get_sheet_frame(area, size):
+    key = (tuple(area), tuple(size))
+    frame = _frame_cache.get(key)
+    if frame is None:
+        sheet = load_master_sheet()
+        if not sheet:
+            return None
+        frame = _frame_cache[key] = pygame.transform.scale(sheet.subsurface(area), size)
+    return frame
+
+# Compiled grid sprites: in memory and on disk, keyed by a hash of grid + palette + scale.
+# Shared like _frame_cache; create_sprite() hands out copies for callers that mutate.
+_sprite_cache = {}
+
+def sprite_key(grid, palette, scale):
+    content = repr((tuple(grid), sorted(palette.items()), scale))
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+def compile_grid(grid, palette):
+    # Whole grid at once: the characters become one byte string, each RGBA channel
+    # is a bytes.translate() through a 256-entry table, and the four channel planes
+    # are interleaved with strided slice assignment. No per-pixel Python calls.
+    cols = max(len(row) for row in grid)
+    text = "".join(row.ljust(cols) for row in grid).encode("latin-1")
+    pixels = bytearray(len(text) * 4)
+    for channel in range(4):
+        table = bytearray(256) # Unlisted characters stay transparent black
+        for char, color in palette.items():
+            rgba = tuple(color) + (255,) if len(color) == 3 else tuple(color)
+            table[ord(char)] = rgba[channel]
+        pixels[channel::4] = text.translate(table)
+    return pygame.image.frombytes(bytes(pixels), (cols, len(grid)), "RGBA")
+
+def compile_sprite(grid, palette, scale=1):
+    # Shared surface: don't mutate it (use SpriteGenerator.create_sprite for a private copy)
+    key = sprite_key(grid, palette, scale)
+    surface = _sprite_cache.get(key)
+    if surface is not None:
+        return surface
+
+    # Raw RGBA on disk (no image codec on the load path); size is part of the file name
+    rows = len(grid)
+    cols = max(len(row) for row in grid)
+    size = (cols * scale, rows * scale)
+    folder = cache_dir()
+    path = os.path.join(folder, f"{key}_{size[0]}x{size[1]}.rgba")
+    try:
+        with open(path, "rb") as f:
+            surface = pygame.image.frombytes(f.read(), size, "RGBA")
+    except (OSError, ValueError, pygame.error):
+        surface = compile_grid(grid, palette)
+        if scale > 1:
+            surface = pygame.transform.scale(surface, size)
+        try:
+            os.makedirs(folder, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(pygame.image.tobytes(surface, "RGBA"))
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Sprite cache not written ({e})")
+
+    surface = _sprite_cache[key] = assets.prepare_image(surface)
+    return surface
+
 class SpriteGenerator:
     @staticmethod
     def create_sprite(grid, palette, scale=1):
-        rows = len(grid)
-        cols = len(grid[0])
-        surface = pygame.Surface((cols, rows), pygame.SRCALPHA)
-        
-        for y, row in enumerate(grid):
-            for x, char in enumerate(row):
-                if char in palette:
-                    surface.set_at((x, y), palette[char])
-        
-        if scale > 1:
-            surface = pygame.transform.scale(surface, (cols * scale, rows * scale))
-            
-        return surface
+        # Private copy of the compiled sprite (Player flashes its image with set_alpha)
+        return compile_sprite(grid, palette, scale).copy()
 
 # Palettes
 VIC_VIPER_PALETTE = {
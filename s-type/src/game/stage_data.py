@@ -0,0 +1,40 @@
+# Stage layouts.
+# Terrain profile segments: (length_in_tiles, floor_height_tiles, ceiling_height_tiles)
+# 28 tile rows tall (672 / 24). Floors below 3 would sit under the PowerUp bar.
+
+STAGE_1_PROFILE = [
+    (40, 3, 0), # Open space to settle in
+    (6, 4, 0),
+    (6, 5, 0),
+    (10, 6, 0),
+    (4, 5, 0),
+    (4, 4, 0),
+    (12, 3, 0),
+    (8, 3, 2), # Cave mouth
+    (16, 4, 3),
+    (6, 5, 3),
+    (10, 4, 4),
+    (8, 3, 2),
+    (20, 3, 0),
+    (4, 8, 0), # Tall rock pillar
+    (16, 3, 0),
+    (6, 4, 1),
+    (6, 5, 2),
+    (12, 4, 1),
+    (14, 3, 0),
+]
+
+# Pre-placed enemies: (tile_column, kind). The layout repeats with the terrain loop.
+STAGE_1_ENEMIES = [
+    (44, "walker"),
+    (58, "walker"),
+    (74, "walker"),
+    (84, "walker"),
+    (100, "walker"),
+    (118, "walker"),
+    (130, "walker"),
+    (142, "walker"),
+    (160, "walker"),
+    (180, "walker"),
+    (196, "walker"),
+]
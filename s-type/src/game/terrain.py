@@ -0,0 +1,226 @@
+import pygame
+from src.settings import INTERNAL_WIDTH, INTERNAL_HEIGHT
+
+TILE_SIZE = 24 # 8 * 3
+CHUNK_COLS = 16 # Tiles per streamed chunk (384px)
+
+# Tile characters
+EMPTY = '.'
+SOLID = '#'
+SLOPE_UP = '/'   # Floor rising to the right
+SLOPE_DOWN = '\\' # Floor falling to the right
+
+ROCK_COLOR = (110, 70, 40)
+ROCK_EDGE_COLOR = (190, 140, 80)
+
+class TileMap:
+    # Stage terrain as rows of tile characters (row 0 = top of screen).
+    # The map loops horizontally so the demo stage never runs out.
+    def __init__(self, rows, tile_size=TILE_SIZE, chunk_cols=CHUNK_COLS):
+        self.rows = rows
+        self.tile_size = tile_size
+        self.chunk_cols = chunk_cols
+        self.height = len(rows)
+        self.width = len(rows[0])
+        self.pixel_width = self.width * tile_size
+        self.chunk_count = (self.width + chunk_cols - 1) // chunk_cols
+
+    @classmethod
+    def from_profile(cls, segments, rows=INTERNAL_HEIGHT // TILE_SIZE):
+        # segments: list of (length_in_cols, floor_tiles, ceiling_tiles)
+        # A floor step of exactly one tile becomes a slope, anything larger is a wall.
+        heights = []
+        for length, floor, ceiling in segments:
+            heights.extend([(floor, ceiling)] * length)
+
+        grid = [[EMPTY] * len(heights) for _ in range(rows)]
+        for col, (floor, ceiling) in enumerate(heights):
+            for row in range(ceiling):
+                grid[row][col] = SOLID
+            for row in range(rows - floor, rows):
+                grid[row][col] = SOLID
+
+            # Slopes sit on top of the lower side of a one-tile step
+            next_floor = heights[(col + 1) % len(heights)][0]
+            prev_floor = heights[col - 1][0]
+            if next_floor == floor + 1:
+                grid[rows - floor - 1][col] = SLOPE_UP
+            elif prev_floor == floor + 1:
+                grid[rows - floor - 1][col] = SLOPE_DOWN
+
+        return cls([''.join(r) for r in grid])
+
+    def tile(self, col, row):
+        if row < 0 or row >= self.height:
+            return EMPTY
+        return self.rows[row][col % self.width]
+
+
+class TerrainRenderer:
+    # Streams column chunks: each chunk is rendered once to a cached surface
+    # a little ahead of the camera and dropped once it has scrolled off the left.
+    def __init__(self, tilemap, lookahead_chunks=1):
+        self.tilemap = tilemap
+        self.lookahead = lookahead_chunks
+        self.chunk_px = tilemap.chunk_cols * tilemap.tile_size
+        self.chunks = {} # world chunk index -> Surface
+        self.tiles = self.build_tiles(tilemap.tile_size)
+
+        # Stats for the debug overlay
+        self.chunks_built = 0
+        self.chunks_evicted = 0
+
+    def build_tiles(self, size):
+        edge = max(3, size // 8)
+        solid = pygame.Surface((size, size), pygame.SRCALPHA)
+        solid.fill(ROCK_COLOR)
+
+        top = solid.copy()
+        top.fill(ROCK_EDGE_COLOR, (0, 0, size, edge))
+
+        up = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.polygon(up, ROCK_COLOR, [(0, size), (size, 0), (size, size)])
+        pygame.draw.line(up, ROCK_EDGE_COLOR, (0, size - 1), (size - 1, 0), edge)
+
+        down = pygame.transform.flip(up, True, False)
+        return {SOLID: solid, 'top': top, SLOPE_UP: up, SLOPE_DOWN: down}
+
+    def render_chunk(self, index):
+        tm = self.tilemap
+        size = tm.tile_size
+        surf = pygame.Surface((self.chunk_px, tm.height * size), pygame.SRCALPHA)
+        first_col = index * tm.chunk_cols
+
+        for c in range(tm.chunk_cols):
+            col = first_col + c
+            for row in range(tm.height):
+                t = tm.tile(col, row)
+                if t == EMPTY:
+                    continue
+                if t == SOLID and tm.tile(col, row - 1) == EMPTY and row > 0:
+                    img = self.tiles['top'] # Exposed floor surface
+                else:
+                    img = self.tiles[t]
+                surf.blit(img, (c * size, row * size))
+
+        self.chunks_built += 1
+        return surf
+
+    def update(self, scroll_x):
+        first = int(scroll_x // self.chunk_px)
+        last = int((scroll_x + INTERNAL_WIDTH) // self.chunk_px) + self.lookahead
+
+        # Evict behind the camera
+        for index in [i for i in self.chunks if i < first]:
+            del self.chunks[index]
+            self.chunks_evicted += 1
+
+        # Stream in ahead of it
+        for index in range(first, last + 1):
+            if index not in self.chunks:
+                self.chunks[index] = self.render_chunk(index)
+
+    def blit_sequence(self, scroll_x):
+        first = int(scroll_x // self.chunk_px)
+        last = int((scroll_x + INTERNAL_WIDTH) // self.chunk_px)
+        batch = []
+        for index in range(first, last + 1):
+            chunk = self.chunks.get(index)
+            if chunk is None: # Not streamed yet (e.g. drawn before the first update)
+                chunk = self.chunks[index] = self.render_chunk(index)
+            batch.append((chunk, (round(index * self.chunk_px - scroll_x), 0)))
+        return batch
+
+
+class TerrainIndex:
+    # Collision lookup built once from the TileMap.
+    # Per pixel column we store the floor surface y and the ceiling bottom y,
+    # plus sparse tables so "lowest floor / deepest ceiling over a span" is O(1).
+    # Queries take screen coordinates; Level keeps scroll_x in sync with the camera.
+    def __init__(self, tilemap):
+        self.tilemap = tilemap
+        self.width = tilemap.pixel_width
+        self.screen_height = tilemap.height * tilemap.tile_size
+        self.scroll_x = 0
+
+        self.floor = [self.screen_height] * self.width # y of the ground surface (screen height = no floor)
+        self.ceiling = [0] * self.width # y just below the ceiling rock (0 = no ceiling)
+        self.build_columns()
+
+        self.floor_table = self.build_sparse(self.floor, min)
+        self.ceiling_table = self.build_sparse(self.ceiling, max)
+
+    def build_columns(self):
+        tm = self.tilemap
+        size = tm.tile_size
+        for col in range(tm.width):
+            # Ceiling: solid run from the top
+            row = 0
+            while row < tm.height and tm.tile(col, row) == SOLID:
+                row += 1
+            ceiling_y = row * size
+
+            # Floor: solid run from the bottom, capped by an optional slope tile
+            row = tm.height - 1
+            while row >= 0 and tm.tile(col, row) == SOLID:
+                row -= 1
+            floor_y = (row + 1) * size
+            slope = tm.tile(col, row)
+
+            for px in range(size):
+                x = col * size + px
+                self.ceiling[x] = ceiling_y
+                if slope == SLOPE_UP:
+                    self.floor[x] = row * size + (size - px)
+                elif slope == SLOPE_DOWN:
+                    self.floor[x] = row * size + px + 1
+                else:
+                    self.floor[x] = floor_y
+
+    def build_sparse(self, values, pick):
+        table = [values]
+        span = 1
+        while span * 2 <= len(values):
+            prev = table[-1]
+            table.append([pick(prev[i], prev[i + span]) for i in range(len(values) - span * 2 + 1)])
+            span *= 2
+        return table
+
+    def range_query(self, table, pick, x0, x1):
+        # Inclusive column range [x0, x1] within the map (no wrap)
+        level = (x1 - x0 + 1).bit_length() - 1
+        row = table[level]
+        return pick(row[x0], row[x1 - (1 << level) + 1])
+
+    def span_query(self, table, pick, screen_left, screen_right):
+        # Handles spans that cross the loop point of the stage
+        x0 = int(screen_left + self.scroll_x) % self.width
+        length = max(1, int(screen_right - screen_left))
+        x1 = x0 + length - 1
+        if x1 < self.width:
+            return self.range_query(table, pick, x0, x1)
+        return pick(self.range_query(table, pick, x0, self.width - 1),
+                    self.range_query(table, pick, 0, x1 - self.width))
+
+    def ground_at(self, screen_x):
+        return self.floor[int(screen_x + self.scroll_x) % self.width]
+
+    def ceiling_at(self, screen_x):
+        return self.ceiling[int(screen_x + self.scroll_x) % self.width]
+
+    def lowest_ground(self, screen_left, screen_right):
+        # Highest point (smallest y) of the floor under a span
+        return self.span_query(self.floor_table, min, screen_left, screen_right)
+
+    def lowest_ceiling(self, screen_left, screen_right):
+        # Lowest point (largest y) of the ceiling over a span
+        return self.span_query(self.ceiling_table, max, screen_left, screen_right)
+
+    def rect_hits(self, rect):
+        if rect.width <= 0 or rect.right <= 0 or rect.left >= INTERNAL_WIDTH:
+            return False
+        left = max(0, rect.left)
+        right = min(INTERNAL_WIDTH, rect.right)
+        if rect.bottom > self.span_query(self.floor_table, min, left, right):
+            return True
+        return rect.top < self.span_query(self.ceiling_table, max, left, right)
@@ -1,11 +1,12 @@
 import pygame
+from src.engine import assets
 from src.settings import SCREEN_HEIGHT, INTERNAL_HEIGHT, INTERNAL_WIDTH
 
 class PowerUpBar:
     def __init__(self, surface, powerup_manager):
         self.surface = surface
         self.manager = powerup_manager
-        self.font = pygame.font.SysFont("arial", 24) # 8 * 3
+        self.font = assets.get_font("hud") or pygame.font.SysFont("arial", 24) # 8 * 3
         
         # Dimensions
         self.bar_height = 48 # 16 * 3
@@ -13,16 +14,54 @@ class PowerUpBar:
         count = len(self.manager.labels)
         self.start_x = (INTERNAL_WIDTH - (self.cell_width * count)) // 2
         self.y = INTERNAL_HEIGHT - self.bar_height - 6 # buffer scaled
+        
+        # Rendered label text, cached by (label, color) so nothing is re-rendered per frame
+        self.label_cache = {}
+        
+        # Cached mode: the whole bar is drawn once into its own surface and only
+        # redrawn when the power-up state changes (QualityGovernor under load)
+        self.cached = False
+        self.bar_surface = None
+        self.bar_state = None
+
+    def get_label(self, label, color):
+        key = (label, color)
+        surf = self.label_cache.get(key)
+        if surf is None:
+            surf = self.label_cache[key] = self.font.render(label[0:4], False, color) # Truncate for space
+        return surf
+
+    def state_key(self):
+        aw = self.manager.active_weapons
+        return (self.manager.meter_index, aw["missile"], aw["double"], aw["laser"], aw["option"], aw["shield"])
 
-    def draw(self):
+    def draw(self, surface=None, state=None):
+        # state: a state_key() captured earlier (pipelined rendering), else read live
+        target = surface if surface is not None else self.surface
+        if state is None:
+            state = self.state_key()
+        if not self.cached:
+            self.draw_cells(target, 0, 0, state)
+            return
+        
+        if self.bar_surface is None or state != self.bar_state:
+            # New surface (not redrawn in place) so the texture renderer re-uploads it
+            self.bar_surface = pygame.Surface((self.cell_width * len(self.manager.labels), self.bar_height), pygame.SRCALPHA)
+            self.draw_cells(self.bar_surface, -self.start_x, -self.y, state)
+            self.bar_state = state
+        target.blit(self.bar_surface, (self.start_x, self.y))
+
+    def draw_cells(self, target, ox, oy, state):
+        current_idx, missile, double, laser, options, shield = state
+        
         # Draw background bar
         # pygame.draw.rect(self.surface, (50, 50, 50), (self.start_x, self.y, self.cell_width * 6, self.bar_height))
         
         for i, label in enumerate(self.manager.labels):
-            x = self.start_x + (i * self.cell_width)
+            x = self.start_x + (i * self.cell_width) + ox
+            y = self.y + oy
             
             # Determine color
-            current_idx = self.manager.meter_index
             bg_color = (100, 0, 0) # Inactive Reddish
             text_color = (200, 200, 200)
             
@@ -31,24 +70,23 @@ class PowerUpBar:
                 text_color = (255, 255, 255)
             
             # Draw Cell
-            pygame.draw.rect(self.surface, bg_color, (x, self.y, self.cell_width - 2, self.bar_height))
+            target.fill(bg_color, (x, y, self.cell_width - 2, self.bar_height))
             
             # Draw Text
             # Logic to Hide text if "Active"/"Taken"
             show_text = True
-            aw = self.manager.active_weapons
             
-            if label == "MISSILE" and aw["missile"]:
+            if label == "MISSILE" and missile:
                  show_text = False
-            elif label == "DOUBLE" and aw["double"]:
+            elif label == "DOUBLE" and double:
                  show_text = False
-            elif label == "LASER" and aw["laser"]:
+            elif label == "LASER" and laser:
                  show_text = False
-            elif label == "OPTION" and aw["option"] >= 4:
+            elif label == "OPTION" and options >= 4:
                  show_text = False
-            elif label == "?" and aw["shield"]:
+            elif label == "?" and shield:
                  show_text = False
             
             if show_text:
-                lbl_surf = self.font.render(label[0:4], False, text_color) # Truncate for space
-                self.surface.blit(lbl_surf, (x + 6, self.y + 10)) # Offsets scaled
+                lbl_surf = self.get_label(label, text_color)
+                target.blit(lbl_surf, (x + 6, y + 10)) # Offsets scaled
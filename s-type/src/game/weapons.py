@@ -1,13 +1,17 @@
 import pygame
 from src.settings import INTERNAL_WIDTH, INTERNAL_HEIGHT
 from src.engine.entity import Entity
-from src.game.sprite_factory import load_master_sheet
+from src.engine.render_queue import LAYER_PLAYER_SHOTS
+from src.game.sprite_factory import load_master_sheet, get_sheet_frame
 
 # Shared sheet loader helper (or just load in each for now to depend less on engine changes)
 def get_sheet():
     return load_master_sheet()
 
 class Projectile(Entity):
+    draw_layer = LAYER_PLAYER_SHOTS
+    hugs_terrain = False # True if the projectile handles terrain itself (Missile)
+    
     def __init__(self, groups, x, y, speed_x, speed_y, color):
         super().__init__(groups, x, y)
         self.image.fill(color)
@@ -24,59 +28,92 @@ class Projectile(Entity):
 class NormalShot(Projectile):
     def __init__(self, groups, x, y):
         super().__init__(groups, x, y, 24, 0, (255, 255, 0))
-        sheet = get_sheet()
-        if sheet:
-            # User specified: 145, 106 (Orange Sprite)
-            # Assuming ~16x10 size based on spacing
-            self.image = sheet.subsurface((145, 106, 16, 8)) 
-            self.image = pygame.transform.scale(self.image, (24, 12)) 
+        # User specified: 145, 106 (Orange Sprite)
+        # Assuming ~16x10 size based on spacing
+        frame = get_sheet_frame((145, 106, 16, 8), (24, 12))
+        if frame:
+            self.image = frame
         
 class Missile(Projectile):
-    def __init__(self, groups, x, y, dx=6, dy=6):
+    hugs_terrain = True
+    STEP_HEIGHT = 12 # Max rise per frame it can climb; anything taller is a wall
+    
+    def __init__(self, groups, x, y, dx=6, dy=6, terrain=None):
         super().__init__(groups, x, y, dx, dy, (255, 0, 0))
-        sheet = get_sheet()
-        if sheet:
-            # User specified 45-degree missile at 130, 158 (8x8)
-            # Pending full animation implementation later.
-            self.image = sheet.subsurface((130, 158, 8, 8)) 
-            self.image = pygame.transform.scale(self.image, (24, 24)) 
+        self.terrain = terrain
+        self.grounded = False
+        # User specified 45-degree missile at 130, 158 (8x8)
+        # Pending full animation implementation later.
+        frame = get_sheet_frame((130, 158, 8, 8), (24, 24))
+        if frame:
+            self.image = frame
         
         # Logic for falling until ground...
     
     def update(self, *args):
+        if not self.terrain:
+            # No stage terrain: fake floor near the bottom of the screen
+            super().update(*args)
+            if self.rect.bottom >= INTERNAL_HEIGHT - 30: 
+                self.vel.y = 0
+                self.vel.x = 9 
+            else:
+                self.vel.y = 6 
+                self.vel.x = 3 
+            return
+        
+        previous_bottom = self.rect.bottom
         super().update(*args)
-        if self.rect.bottom >= INTERNAL_HEIGHT - 30: 
+        if not self.alive():
+            return
+        
+        ground = self.terrain.ground_at(self.rect.centerx)
+        if self.grounded:
+            # Hug the floor: follow slopes, drop off ledges, explode on walls
+            if ground < self.rect.bottom - self.STEP_HEIGHT:
+                self.kill()
+                return
+            if ground > self.rect.bottom + self.STEP_HEIGHT:
+                self.grounded = False
+        elif self.rect.bottom >= ground:
+            # Falling into the side of a wall explodes too, landing needs a floor below
+            if ground < previous_bottom - self.STEP_HEIGHT:
+                self.kill()
+                return
+            self.grounded = True
+        
+        if self.grounded:
+            self.rect.bottom = ground
+            self.pos.y = self.rect.top
             self.vel.y = 0
             self.vel.x = 9 
         else:
             self.vel.y = 6 
             self.vel.x = 3 
+        
+        if self.rect.top < self.terrain.ceiling_at(self.rect.centerx):
+            self.kill()
 
 class Double(Projectile):
     def __init__(self, groups, x, y, direction_y=-1):
         super().__init__(groups, x, y, 15, 15 * direction_y, (0, 255, 255))
-        sheet = get_sheet()
-        if sheet:
-            # User specified Double sprite at 133, 104 (6x6)
-            # "Diagonal sprite"
-            self.image = sheet.subsurface((133, 104, 6, 6)) 
-            self.image = pygame.transform.scale(self.image, (18, 18)) # 3x Scale
+        # User specified Double sprite at 133, 104 (6x6)
+        # "Diagonal sprite"
+        frame = get_sheet_frame((133, 104, 6, 6), (18, 18)) # 3x Scale
+        if frame:
+            self.image = frame
 
 class Laser(Projectile):
     def __init__(self, groups, x, y):
         # Laser is unique: huge hitbox, piercing (handled elsewhere?), animation.
         super().__init__(groups, x, y, 36, 0, (100, 100, 255))
-        sheet = get_sheet()
         self.frames = []
-        if sheet:
+        if get_sheet():
             # User specified: 112, 109 and 122, 109
             # Distance is 10px. Width is likely 10. Height maybe 4?
-            f1 = sheet.subsurface((112, 109, 10, 4))
-            f2 = sheet.subsurface((122, 109, 10, 4))
-            
             # Scale to long beam
-            self.frames.append(pygame.transform.scale(f1, (144, 24)))
-            self.frames.append(pygame.transform.scale(f2, (144, 24)))
+            self.frames.append(get_sheet_frame((112, 109, 10, 4), (144, 24)))
+            self.frames.append(get_sheet_frame((122, 109, 10, 4), (144, 24)))
             
             self.image = self.frames[0]
             # Reset rect to match scaled size if needed, though Entity init did it with fallback color surf
@@ -12,6 +12,41 @@ FPS = 60
 # Authenticity
 SLOWDOWN_ENABLED = True
 SLOWDOWN_THRESHOLD = 20  # Number of entities before slowdown kicks in (arbitrary start value)
+SLOWDOWN_FPS = 40 # Frame rate while slowdown is active (replaces the old sleep)
+
+QUALITY_GOVERNOR = True # Drop cosmetic detail under load instead of slowing down
+
+# Fast-forward: simulation steps per rendered frame (cycled with F7)
+SIM_SPEEDS = [1, 2, 4, 8]
+
+# Frame Pacing ("sleep", "busy" or "vsync")
+PACING_MODE = "busy"
+
+# Activation: placed enemies wake this many px before they scroll on screen
+ACTIVATION_MARGIN = 64
+
+# Compiled grid sprites are cached here by content hash (skipped if not writable).
+# Relative to the project folder; a built exe uses the user's cache directory instead.
+SPRITE_CACHE_DIR = ".sprite_cache"
+
+# Particles
+PARTICLE_CAPACITY = 4096 # Preallocated particle slots
+PARTICLE_EMIT_CAP = 600 # Max new particles per frame
+
+# Rendering ("surface" software blits or "texture" SDL2 renderer)
+RENDERER = "surface"
+
+# Audio
+AUDIO_ENABLED = True
+AUDIO_FREQUENCY = 22050
+AUDIO_BUFFER = 256 # Samples per mixer callback (~12ms at 22kHz); pygame's default 512+ adds audible lag
+AUDIO_CHANNELS = {"shot": 4, "explosion": 6, "powerup": 2} # Reserved voices per category
+
+# Pipelined mode: simulate frame N on a worker thread while frame N-1 renders
+PIPELINED = False
+
+# Input
+LATE_INPUT_SAMPLING = False # Re-poll input right before the simulation tick
 
 # Colors
 COLOR_BLACK = (0, 0, 0)